@@ -1,9 +1,10 @@
-from .composite import Composite
+from .composite import Composite, LoaderSpec
 from .dict import Dict
 from .env import Environment
 from .json import Json
 from .json_string import JsonString
 from .yaml import Yaml
+from .yaml_stream import YamlStream
 try:
     from .toml_full_features import Toml
 
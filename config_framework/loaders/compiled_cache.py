@@ -0,0 +1,156 @@
+import hashlib
+import marshal
+import os
+import sys
+from functools import partial
+from os import PathLike
+from pathlib import Path
+from typing import Any, Callable, MutableMapping, Optional, Union
+
+from config_framework.loaders.file_io import (
+    DEFAULT_MMAP_THRESHOLD, atomic_write, open_buffer
+)
+
+# Directory used if cache is enabled without specifying where it is
+DEFAULT_CACHE_DIR_NAME: str = "__config_cache__"
+CACHE_SUFFIX: str = ".marshal"
+
+ParsedDocument = Optional[MutableMapping[str, Any]]
+
+
+def describe_parser(parser: Any) -> str:
+    """
+    Gives text describing parser that stays the same between runs,
+    unlike repr of functions that contains their address.
+
+    :param parser: function, partial or any object used for parsing.
+    :return: description of parser.
+    """
+    if isinstance(parser, partial):
+        args = ", ".join(describe_parser(arg) for arg in parser.args)
+        kwargs = ", ".join(
+            f"{name}={describe_parser(value)}"
+            for name, value in sorted(parser.keywords.items())
+        )
+        return f"partial({describe_parser(parser.func)}, {args}, {kwargs})"
+
+    qualname: Optional[str] = getattr(parser, "__qualname__", None)
+    if qualname is not None:
+        return f"{getattr(parser, '__module__', '')}.{qualname}"
+
+    if isinstance(parser, (tuple, list)):
+        return f"({', '.join(describe_parser(item) for item in parser)})"
+
+    return repr(parser)
+
+
+def resolve_cache_dir(
+    path: Union[PathLike, Path, str],
+    compiled_cache: Union[bool, PathLike, Path, str]
+) -> Optional[Path]:
+    """
+    Gives directory where compiled files are stored.
+
+    :param path: path to source file.
+    :param compiled_cache: False to disable cache, True to store it
+        next to source file or directory to store it in.
+    :return: path to directory or None if cache is disabled.
+    """
+    if compiled_cache is False:
+        return None
+
+    if compiled_cache is True:
+        return Path(path).parent / DEFAULT_CACHE_DIR_NAME
+
+    return Path(compiled_cache)
+
+
+def read_compiled(
+    path: Union[PathLike, Path, str],
+    parse: Callable[[Any], ParsedDocument],
+    fingerprint: str,
+    cache_dir: Union[PathLike, Path, str],
+    mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+) -> ParsedDocument:
+    """
+    Gives parsed file from compiled cache, parsing it and saving
+    result to cache if there's no compiled version of this file content.
+
+    Compiled files are named after source path, parser fingerprint and
+    hash of file content and python version, so changing any of them
+    makes file parsed again. Loaders reading same file with different
+    settings keep their own compiled files. Documents that can't be
+    marshalled (for example having dates) aren't cached.
+
+    :param path: path to source file.
+    :param parse: function that parses content of file, given as bytes
+        or memory map, that is the same content hash was made of.
+    :param fingerprint: text describing parser and its settings.
+    :param cache_dir: where compiled files are stored.
+    :param mmap_threshold: file size in bytes starting from which file
+        is memory mapped instead of being read, None disables it.
+    :return: parsed document.
+    """
+    cache_dir = Path(cache_dir)
+    source_id = hashlib.sha256(
+        os.fsencode(os.path.realpath(path))
+    ).hexdigest()[:16]
+    parser_id = hashlib.sha256(
+        f"{sys.version}\0{fingerprint}".encode("utf8")
+    ).hexdigest()[:16]
+
+    with open_buffer(path, mmap_threshold) as buffer:
+        content_hash = hashlib.sha256(buffer).hexdigest()
+        compiled_path = cache_dir / (
+            f"{source_id}-{parser_id}-{content_hash}{CACHE_SUFFIX}"
+        )
+
+        try:
+            with open(compiled_path, "rb") as compiled_f:
+                return marshal.loads(compiled_f.read())
+
+        except (OSError, EOFError, ValueError, TypeError):
+            # Missing or broken compiled file is just parsed again
+            pass
+
+        # Parsing the same content that was hashed, so file changed
+        # in the meantime can't be cached under outdated hash
+        document = parse(buffer)
+
+    # marshal handles only plain dicts
+    if not isinstance(document, dict):
+        return document
+
+    try:
+        compiled = marshal.dumps(document)
+
+    except ValueError:
+        return document
+
+    try:
+        _write_compiled(
+            cache_dir, compiled_path, f"{source_id}-{parser_id}", compiled
+        )
+
+    except OSError:
+        # Read-only or full disk must not break loading config
+        pass
+
+    return document
+
+
+def _write_compiled(
+    cache_dir: Path, compiled_path: Path, prefix: str, compiled: bytes
+) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    atomic_write(compiled_path, compiled)
+
+    # Compiled versions of previous content of same file,
+    # parsed with same settings, aren't needed
+    for stale_path in cache_dir.glob(f"{prefix}-*{CACHE_SUFFIX}"):
+        if stale_path != compiled_path:
+            try:
+                stale_path.unlink()
+
+            except OSError:
+                pass
@@ -1,44 +1,352 @@
-from collections import ChainMap
-from typing import Optional, MutableMapping, Any, Tuple, Union
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import (
+    Optional, MutableMapping, Mapping, Any, Tuple, Dict, List,
+    NamedTuple, Type, Union, Awaitable, cast
+)
 
-from config_framework.types.abstract import AbstractLoader
-from config_framework.types.variable_key import VariableKey
+from config_framework.types.abstract import AbstractLoader, MISSING
+from config_framework.types.custom_exceptions import (
+    LoadingError, SavingError
+)
+from config_framework.types.merged_view import MergedView
+from config_framework.types.variable_key import (
+    KeyLike, KeyPath, compile_key, format_path
+)
+
+
+class LoaderSpec(NamedTuple):
+    """
+    Describes how to create loader: which loader class to use
+    and what arguments to pass to its load method.
+    """
+    loader: Type[AbstractLoader]
+    args: Tuple[Any, ...] = ()
+    kwargs: Mapping[str, Any] = {}
+
+    def load(self) -> AbstractLoader:
+        return self.loader.load(*self.args, **self.kwargs)  # type: ignore
+
+    async def aload(self) -> AbstractLoader:
+        return await self.loader.aload(*self.args, **self.kwargs)
 
 
 class Composite(AbstractLoader):
     loaders: Tuple[AbstractLoader, ...]
+    deep_merge: bool
+    _origins: Dict[KeyPath, AbstractLoader]
+    _sources: Dict[str, AbstractLoader]
 
     def __init__(
         self, data: MutableMapping[str, Any],
         defaults: MutableMapping[str, Any],
-        loaders: Tuple[AbstractLoader, ...]
+        loaders: Tuple[AbstractLoader, ...],
+        deep_merge: bool = False
     ):
-        super().__init__(data, defaults)
         self.loaders = loaders
+        self.deep_merge = deep_merge
+        self._origins = {}
+        self._sources = {}
+
+        if deep_merge:
+            data = self._merge_values(
+                (), [(loader, loader) for loader in self.loaders]
+            )
+
+        super().__init__(data, defaults)
+        for loader in self.loaders:
+            loader._add_dependent(self)
 
     @classmethod
     def load(
         cls, *loaders: AbstractLoader,
-        defaults: Optional[MutableMapping[str, Any]] = None
+        defaults: Optional[MutableMapping[str, Any]] = None,
+        deep_merge: bool = False
     ):
         """
         Initializes composite loader.
 
         :param loaders: any number of different config sources that can be used for providing configuration.
         :param defaults: default values.
+        :param deep_merge: merge nested sections of all loaders into one
+            tree instead of taking whole top level section from
+            the first loader that has it.
         :return: instance of composite loader.
         """
         return cls(
-            data=ChainMap(*loaders),
+            data={} if deep_merge else MergedView(*loaders),
             defaults=defaults or {},
-            loaders=loaders
+            loaders=loaders,
+            deep_merge=deep_merge
         )
 
+    @classmethod
+    def load_parallel(
+        cls, *specs: LoaderSpec,
+        defaults: Optional[MutableMapping[str, Any]] = None,
+        deep_merge: bool = False,
+        use_processes: bool = False,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Creates all loaders concurrently and then initializes
+        composite loader from them, keeping order of specs as priority.
+
+        :param specs: descriptions of loaders to create.
+        :param defaults: default values.
+        :param deep_merge: merge nested sections of all loaders into one tree.
+        :param use_processes: parse in process pool instead of threads,
+            which helps with formats parsed by pure python code. Loader
+            classes and their arguments must be picklable then.
+        :param max_workers: how many loaders can be created at once.
+        :return: instance of composite loader.
+        :raises config_framework.types.custom_exceptions.LoadingError:
+            if any of loaders couldn't be created, with all errors inside.
+        """
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        loaders: List[AbstractLoader] = []
+        errors: List[Tuple[Any, BaseException]] = []
+        with executor:
+            futures = [executor.submit(spec.load) for spec in specs]
+            for spec, future in zip(specs, futures):
+                try:
+                    loaders.append(future.result())
+
+                except Exception as error:
+                    errors.append((spec, error))
+
+        if errors:
+            raise LoadingError(errors)
+
+        return cls.load(*loaders, defaults=defaults, deep_merge=deep_merge)
+
+    @classmethod
+    async def aload(
+        cls, *loaders: Union[
+            AbstractLoader, LoaderSpec, Awaitable[AbstractLoader]
+        ],
+        defaults: Optional[MutableMapping[str, Any]] = None,
+        deep_merge: bool = False
+    ):
+        """
+        Initializes composite loader without blocking event loop.
+        Loaders that aren't created yet are loaded concurrently.
+
+        :param loaders: loaders, specs of loaders or awaitables giving
+            loaders, in order of priority.
+        :param defaults: default values.
+        :param deep_merge: merge nested sections of all loaders into one tree.
+        :return: instance of composite loader.
+        :raises config_framework.types.custom_exceptions.LoadingError:
+            if any of loaders couldn't be created, with all errors inside.
+        """
+        async def as_loader(
+            loader: Union[
+                AbstractLoader, LoaderSpec, Awaitable[AbstractLoader]
+            ]
+        ) -> AbstractLoader:
+            if isinstance(loader, AbstractLoader):
+                return loader
+
+            if isinstance(loader, LoaderSpec):
+                return await loader.aload()
+
+            return await loader
+
+        results = await asyncio.gather(
+            *(as_loader(loader) for loader in loaders),
+            return_exceptions=True
+        )
+        errors: List[Tuple[Any, BaseException]] = [
+            (loader, result)
+            for loader, result in zip(loaders, results)
+            if isinstance(result, BaseException)
+        ]
+        if errors:
+            raise LoadingError(errors)
+
+        # Only loaders are left after errors were checked
+        loaded = cast(List[AbstractLoader], results)
+        return cls.load(*loaded, defaults=defaults, deep_merge=deep_merge)
+
+    async def adump(self, include_defaults: bool = False) -> None:
+        """
+        Dumps all loaders concurrently without blocking event loop.
+
+        :param include_defaults: not used.
+        :return: nothing.
+        """
+        await asyncio.gather(*(loader.adump() for loader in self.loaders))
+
     def dump(self, include_defaults: bool = False) -> None:
         for loader in self.loaders:
             loader.dump()
 
-    def __delitem__(self, key: Union[str, VariableKey]) -> None:
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Tells if any of loaders was changed since it was dumped.
+        """
+        return any(loader.is_dirty for loader in self.loaders)
+
+    def save(
+        self, include_defaults: bool = False, force: bool = False
+    ) -> bool:
+        """
+        Dumps loaders that were changed, concurrently. Like dump, this never
+        writes defaults of loaders inside: include_defaults is ignored,
+        so each loader must be saved by itself to write its defaults.
+
+        :param include_defaults: not used.
+        :param force: dump every loader, even ones that weren't changed
+            through composite loader or by themselves.
+        :return: True if any of loaders was dumped or scheduled to be dumped.
+        :raises config_framework.types.custom_exceptions.SavingError:
+            if any of loaders couldn't be saved, with all errors inside.
+        """
+        return super().save(include_defaults, force)
+
+    def _save_now(
+        self, include_defaults: bool = False, force: bool = False,
+        in_background: bool = False
+    ) -> bool:
+        """
+        Dumps changed loaders concurrently, skipping ones that weren't changed.
+
+        :param include_defaults: not used, same as in dump.
+        :param force: dump every loader, even ones that weren't changed.
+        :param in_background: not used, loaders are saved by themselves.
+        :return: True if any of loaders was dumped.
+        :raises config_framework.types.custom_exceptions.SavingError:
+            if any of loaders couldn't be saved, with all errors inside.
+        """
+        dirty_loaders = [
+            loader for loader in self.loaders if force or loader.is_dirty
+        ]
+        self._clear_modified()
+        if not dirty_loaders:
+            return False
+
+        errors: List[Tuple[Any, BaseException]] = []
+        with ThreadPoolExecutor(max_workers=len(dirty_loaders)) as executor:
+            futures = [
+                executor.submit(loader.save, False, force)
+                for loader in dirty_loaders
+            ]
+            for loader, future in zip(dirty_loaders, futures):
+                try:
+                    future.result()
+
+                except Exception as error:
+                    errors.append((loader, error))
+
+        if errors:
+            raise SavingError(errors)
+
+        return True
+
+    def __setitem__(self, key: KeyLike, value: Any) -> None:
+        """
+        Sets an item value inside of the loader, that provides it,
+        so that loader and everything depending on it knows about change.
+
+        :param key: key that is used to find an item.
+        :param value: new value.
+        :return: nothing.
+        :raises KeyError: if corresponding item wasn't found.
+        """
+        path = compile_key(key)
+        if self.deep_merge:
+            origin: Optional[AbstractLoader] = self._origins.get(path)
+            if origin is not None:
+                origin[path] = value
+                return
+
+        else:
+            for loader in self.loaders:
+                if path[0] in loader:
+                    loader[path] = value
+                    return
+
+        # Only defaults have this key
+        variable: MutableMapping[str, Any] = self.defaults
+        for sub_key in path[:-1]:
+            try:
+                variable = variable[sub_key]
+
+            except KeyError as key_error:
+                raise KeyError(
+                    f"Couldn't find any value using key: {format_path(path)}"
+                ) from key_error
+
+        if path[-1] not in variable:
+            raise KeyError(
+                f"There's no such key in loader: {format_path(path)}"
+            )
+
+        variable[path[-1]] = value
+        self._notify_changed(path)
+
+    def _on_source_changed(
+        self, source: AbstractLoader, path: Optional[KeyPath]
+    ) -> None:
+        if self.deep_merge:
+            self._notify_changed(self._remerge(path))
+            return
+
+        if path is None:
+            self._sources.clear()
+
+        elif len(path) == 1:
+            self._sources.pop(path[0], None)
+
+        super()._on_source_changed(source, path)
+
+    def source_of(self, key: KeyLike) -> AbstractLoader:
+        """
+        Gives loader from which value under key is taken.
+
+        :param key: key of value.
+        :return: loader instance.
+        :raises KeyError: if none of loaders provides this value.
+        """
+        path = compile_key(key)
+        if self.deep_merge:
+            origin: Optional[AbstractLoader] = self._origins.get(path)
+            if origin is None:
+                raise KeyError(
+                    f"Couldn't find any value using key: {format_path(path)}"
+                )
+
+            return origin
+
+        # Whole top level section is taken from the first loader having it
+        source: Optional[AbstractLoader] = self._sources.get(path[0])
+        if source is None:
+            for loader in self.loaders:
+                if path[0] in loader:
+                    source = self._sources[path[0]] = loader
+                    break
+
+            else:
+                raise KeyError(
+                    f"Couldn't find any value using key: {format_path(path)}"
+                )
+
+        if len(path) > 1 and source.get_many((path,))[0] is MISSING:
+            raise KeyError(
+                f"Couldn't find any value using key: {format_path(path)}"
+            )
+
+        return source
+
+    def __delitem__(self, key: KeyLike) -> None:
         error_counter = 0
         for loader in self.loaders:
             try:
@@ -49,5 +357,129 @@ class Composite(AbstractLoader):
 
         if error_counter == len(self.loaders):
             raise KeyError(
-                f"Couldn't find any value using key: {key}"
+                "Couldn't find any value using key: "
+                f"{format_path(compile_key(key))}"
             )
+
+    def _merge_values(
+        self, path: KeyPath,
+        layers: List[Tuple[AbstractLoader, Any]]
+    ) -> Any:
+        """
+        Merges values that loaders have under the same path.
+
+        :param path: path of values.
+        :param layers: loaders and their values, ordered by priority.
+        :return: merged value.
+        """
+        top_loader, top_value = layers[0]
+        self._origins[path] = top_loader
+        if not isinstance(top_value, Mapping):
+            return top_value
+
+        mapping_layers: List[Tuple[AbstractLoader, Mapping]] = []
+        for loader, value in layers:
+            # Anything below a plain value is shadowed by it
+            if not isinstance(value, Mapping):
+                break
+
+            mapping_layers.append((loader, value))
+
+        merged: Dict[str, Any] = {}
+        for _, mapping in reversed(mapping_layers):
+            merged.update(dict.fromkeys(mapping))
+
+        for key in merged:
+            merged[key] = self._merge_values(
+                path + (key,),
+                [
+                    (loader, mapping[key])
+                    for loader, mapping in mapping_layers
+                    if key in mapping
+                ]
+            )
+
+        return merged
+
+    def _remerge(self, path: Optional[KeyPath]) -> Optional[KeyPath]:
+        """
+        Merges again part of tree, which is affected by change of path
+        in one of loaders.
+
+        :param path: changed path or None if everything could change.
+        :return: path that was merged again or None if it's whole tree.
+        """
+        if path is None:
+            self._origins.clear()
+            self.data = self._merge_values(
+                (), [(loader, loader) for loader in self.loaders]
+            )
+            self.lookup_data = MergedView(self.data, self.defaults)
+            return None
+
+        root = self._affected_root(path)
+        parent: Any = self.data
+        for sub_key in root[:-1]:
+            parent = parent[sub_key]
+
+        old_value = parent.pop(root[-1], MISSING)
+        self._forget_origins(root, old_value)
+
+        layers = [
+            (loader, value)
+            for loader, value in zip(
+                self.loaders,
+                (loader.get_many((root,))[0] for loader in self.loaders)
+            )
+            if value is not MISSING
+        ]
+        if layers:
+            parent[root[-1]] = self._merge_values(root, layers)
+
+        return root
+
+    def _affected_root(self, path: KeyPath) -> KeyPath:
+        """
+        Finds the shallowest part of path, that must be merged again.
+        Usually it's path itself, unless some of loaders don't have
+        mappings on the way to it.
+
+        :param path: changed path.
+        :return: part of path.
+        """
+        merged: Any = self.data
+        for depth in range(1, len(path)):
+            prefix = path[:depth]
+            merged = merged.get(prefix[-1], MISSING)
+            if not isinstance(merged, Mapping):
+                return prefix
+
+            for loader in self.loaders:
+                value = loader.get_many((prefix,))[0]
+                if value is not MISSING and not isinstance(value, Mapping):
+                    return prefix
+
+        return path
+
+    def _forget_origins(self, path: KeyPath, old_value: Any) -> None:
+        """
+        Removes origins of value that was dropped from merged tree.
+
+        :param path: path of dropped value.
+        :param old_value: dropped value.
+        :return: nothing.
+        """
+        self._origins.pop(path, None)
+        stack: List[Tuple[KeyPath, Any]] = [(path, old_value)]
+        while stack:
+            current_path, current = stack.pop()
+            if isinstance(current, Mapping):
+                for key, child in current.items():
+                    child_path = current_path + (key,)
+                    self._origins.pop(child_path, None)
+                    stack.append((child_path, child))
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        for loader in self.loaders:
+            loader._add_dependent(self)
@@ -7,16 +7,22 @@ class Dict(AbstractLoader):
     @classmethod
     def load(
         cls, data: MutableMapping[str, Any],
-        defaults: Optional[MutableMapping[str, Any]] = None
+        defaults: Optional[MutableMapping[str, Any]] = None,
+        flat_index: bool = False
     ):
         """
         Wrapper for dicts usage as config source.
 
         :param data: argument expects dictionary that will be used as source.
         :param defaults: default values.
+        :param flat_index: index every value by its full path at load time.
         :return: instance of dict loader.
         """
-        return cls(data=data, defaults=defaults or {})
+        loader = cls(data=data, defaults=defaults or {})
+        if flat_index:
+            loader.enable_flat_index()
+
+        return loader
 
     def dump(self, include_defaults: bool = False) -> None:
         """
@@ -1,19 +1,211 @@
 from os import environ
-from typing import Optional, MutableMapping, Any
+from typing import (
+    Optional, MutableMapping, Any, Dict, Iterable, Iterator, List, Union
+)
 
-from config_framework.types.abstract import AbstractLoader
+from config_framework.types.abstract import AbstractLoader, MISSING
+from config_framework.types.variable_key import (
+    KeyLike, KeyPath, compile_key, intern_path
+)
+
+# Every level maps lowercase part of name to its sub-level
+# or to the name of environment variable
+EnvironmentIndex = Dict[str, Union["EnvironmentIndex", str]]
+
+
+def build_environment_index(
+    names: Iterable[str], prefix: str, delimiter: str = "__"
+) -> EnvironmentIndex:
+    """
+    Groups names of environment variables with prefix into tree
+    by parts separated with delimiter, ignoring case.
+    If variable is both value and section (APP__DB and APP__DB__HOST),
+    section is kept.
+
+    :param names: names of environment variables.
+    :param prefix: prefix of names, like APP.
+    :param delimiter: separator of name parts.
+    :return: tree of lowercase name parts.
+    """
+    full_prefix = prefix.upper()
+    if not full_prefix.endswith(delimiter):
+        full_prefix += delimiter
+
+    index: EnvironmentIndex = {}
+    for name in names:
+        if not name.upper().startswith(full_prefix):
+            continue
+
+        pieces: List[str] = [
+            piece.lower()
+            for piece in name[len(full_prefix):].split(delimiter)
+            if piece
+        ]
+        if not pieces:
+            continue
+
+        level = index
+        for piece in pieces[:-1]:
+            sub_level = level.get(piece)
+            if not isinstance(sub_level, dict):
+                sub_level = level[piece] = {}
+
+            level = sub_level
+
+        if not isinstance(level.get(pieces[-1]), dict):
+            level[pieces[-1]] = name
+
+    return index
+
+
+class EnvironmentView(MutableMapping):
+    """
+    Nested view of environment variables built from index. Values are
+    read from environment on every access, so no copy of it is made.
+    Changes are kept in overlay shared by all levels of view and
+    never get into real environment.
+    """
+    def __init__(
+        self, index: EnvironmentIndex,
+        path: KeyPath = (),
+        overlay: Optional[Dict[KeyPath, Any]] = None,
+        source: Optional[MutableMapping[str, str]] = None
+    ):
+        """
+        :param index: tree of names of environment variables.
+        :param path: path of this level from the root of view.
+        :param overlay: values set or deleted through view.
+        :param source: mapping with environment, os.environ if not set.
+        :return: nothing.
+        """
+        self._index = index
+        self._path = path
+        self._overlay: Dict[KeyPath, Any] = {} if overlay is None else overlay
+        self._source = source
+
+    @property
+    def source(self) -> MutableMapping[str, str]:
+        """
+        Gives mapping environment is read from.
+        """
+        return environ if self._source is None else self._source
+
+    def _sub_path(self, key: str) -> KeyPath:
+        return self._path + (key.lower(),)
+
+    def __getitem__(self, key: str) -> Any:
+        path = self._sub_path(key)
+        value = self._overlay.get(path, MISSING)
+        if value is not MISSING:
+            return value
+
+        if path in self._overlay:
+            # Deleted through view
+            raise KeyError(key)
+
+        entry = self._index[path[-1]]
+        if isinstance(entry, dict):
+            return EnvironmentView(entry, path, self._overlay, self._source)
+
+        return self.source[entry]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._overlay[self._sub_path(key)] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self._overlay[self._sub_path(key)] = MISSING
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+
+        try:
+            self[key]
+
+        except KeyError:
+            return False
+
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        depth = len(self._path) + 1
+        added = [
+            path[-1] for path, value in self._overlay.items()
+            if len(path) == depth and path[:-1] == self._path
+            and value is not MISSING and path[-1] not in self._index
+        ]
+        for key in (*self._index, *added):
+            if key in self:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
 
 
 class Environment(AbstractLoader):
+    case_insensitive: bool = False
+
     @classmethod
-    def load(cls, defaults: Optional[MutableMapping[str, Any]] = None):
+    def load(
+        cls, defaults: Optional[MutableMapping[str, Any]] = None,
+        prefix: Optional[str] = None,
+        delimiter: str = "__"
+    ):
         """
         Loads data from environment.
 
         :param defaults: default values.
+        :param prefix: if specified, only variables starting with it
+            are used, and their names are split by delimiter into
+            nested keys (APP__DB__POOL_SIZE becomes db / pool_size).
+            Values are read from environment on access and keys
+            are case-insensitive, so defaults must have lowercase keys.
+        :param delimiter: separator of nested keys in names.
         :return: instance of env loader.
         """
-        return cls(data=dict(environ), defaults=defaults or {})
+        if prefix is None:
+            return cls(data=dict(environ), defaults=defaults or {})
+
+        loader = cls(
+            data=EnvironmentView(
+                build_environment_index(environ, prefix, delimiter)
+            ),
+            defaults=defaults or {}
+        )
+        loader.case_insensitive = True
+        return loader
+
+    def _normalize(self, key: KeyLike) -> KeyPath:
+        path = compile_key(key)
+        if self.case_insensitive:
+            return intern_path(piece.lower() for piece in path)
+
+        return path
+
+    def get_many(self, keys: Iterable[KeyLike]) -> List[Any]:
+        return super().get_many(self._normalize(key) for key in keys)
+
+    def __getitem__(self, key: KeyLike) -> Any:
+        return super().__getitem__(self._normalize(key))
+
+    def __setitem__(self, key: KeyLike, value: Any) -> None:
+        super().__setitem__(self._normalize(key), value)
+
+    def __delitem__(self, key: KeyLike) -> None:
+        super().__delitem__(self._normalize(key))
+
+    def __contains__(self, key: object) -> bool:
+        # Other keys are checked through __getitem__
+        if self.case_insensitive and isinstance(key, str):
+            key = key.lower()
+
+        return super().__contains__(key)
 
     def dump(self, include_defaults: bool = False) -> None:
         """
@@ -0,0 +1,119 @@
+import codecs
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from os import PathLike
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+# Files of this size and bigger are memory mapped by default
+DEFAULT_MMAP_THRESHOLD: int = 32 * 1024 * 1024
+
+FileBuffer = Union[bytes, mmap.mmap]
+
+
+@contextmanager
+def open_buffer(
+    path: Union[PathLike, Path, str],
+    mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+) -> Iterator[FileBuffer]:
+    """
+    Gives content of file as read-only memory map if file is big enough,
+    otherwise as bytes. Memory map supports file-like reading as well as
+    buffer protocol, so parsers can read it without making text copy
+    of a whole file.
+
+    :param path: path to file.
+    :param mmap_threshold: size in bytes starting from which file is
+        memory mapped, or None to always read it.
+    :return: context manager giving file content.
+    """
+    with open(path, mode="rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        # Empty files can't be mapped
+        if mmap_threshold is None or size == 0 or size < mmap_threshold:
+            yield file.read()
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def is_utf8(encoding: str) -> bool:
+    """
+    Tells if encoding is utf-8 without BOM.
+
+    :param encoding: name of encoding.
+    :return: bool.
+    """
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+def write_if_changed(path: Union[PathLike, Path, str], content: bytes) -> bool:
+    """
+    Writes content to file unless file already has exactly this content.
+
+    :param path: path to file.
+    :param content: new content of file.
+    :return: True if file was written.
+    """
+    try:
+        # Different size means different content without reading file
+        if os.stat(path).st_size == len(content):
+            with open(path, mode="rb") as file:
+                if file.read() == content:
+                    return False
+
+    except OSError:
+        pass
+
+    atomic_write(path, content)
+    return True
+
+
+def atomic_write(path: Union[PathLike, Path, str], content: bytes) -> None:
+    """
+    Writes content to temporary file next to path and then renames it,
+    so readers never see partially written file.
+    Permissions of existing file are kept.
+
+    :param path: path to file.
+    :param content: new content of file.
+    :return: nothing.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def write_text_if_changed(
+    path: Union[PathLike, Path, str], text: str, encoding: str
+) -> bool:
+    """
+    Writes text to file unless file already has exactly this text.
+    Line endings are converted same way as files opened in text mode do.
+
+    :param path: path to file.
+    :param text: new content of file.
+    :param encoding: encoding of file.
+    :return: True if file was written.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+
+    return write_if_changed(path, text.encode(encoding))
@@ -0,0 +1,179 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from config_framework.types.abstract import MISSING
+from config_framework.types.variable_key import KeyPath
+
+try:
+    import tomlkit  # type: ignore
+
+except ImportError:
+    tomlkit = None  # type: ignore
+
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def collect_changes(
+    document: Any, paths: Iterable[KeyPath]
+) -> Dict[KeyPath, Any]:
+    """
+    Gives new values of changed paths.
+
+    :param document: data that is going to be written.
+    :param paths: changed paths.
+    :return: paths mapped to their values or MISSING if they were deleted.
+    """
+    changes: Dict[KeyPath, Any] = {}
+    for path in paths:
+        value: Any = document
+        for sub_key in path:
+            if not isinstance(value, dict) or sub_key not in value:
+                value = MISSING
+                break
+
+            value = value[sub_key]
+
+        changes[path] = value
+
+    return changes
+
+
+def patch_yaml(
+    text: str, changes: Dict[KeyPath, Any], loader_cls: type
+) -> Optional[str]:
+    """
+    Replaces text of changed scalar values of yaml document,
+    keeping comments and layout of everything else.
+
+    :param text: current content of file.
+    :param changes: paths mapped to their new values.
+    :param loader_cls: yaml loader class that is used to compose document.
+    :return: new content of file or None if structure changed
+        and document must be written from scratch.
+    """
+    try:
+        root: Optional[yaml.Node] = yaml.compose(text, Loader=loader_cls)
+
+    except yaml.YAMLError:
+        return None
+
+    if root is None:
+        return None
+
+    # Anchored nodes are shared between places, and they can't be
+    # changed in one place only
+    uses = Counter(id(node) for node in _walk_nodes(root))
+    replacements: List[Tuple[int, int, str]] = []
+    for path, value in changes.items():
+        if value is MISSING or not isinstance(value, _SCALAR_TYPES):
+            return None
+
+        node = _find_yaml_node(root, path)
+        if not isinstance(node, yaml.ScalarNode) or uses[id(node)] > 1:
+            return None
+
+        start, end = node.start_mark.index, node.end_mark.index
+        original = text[start:end]
+        if original.startswith(("&", "!", "*")):
+            return None
+
+        # Block scalars span up to the next line, which must stay there
+        trailing = original[len(original.rstrip()):]
+        replacements.append((start, end, _yaml_scalar(value) + trailing))
+
+    # Replacing from the end keeps positions of other spans right
+    replacements.sort(reverse=True)
+    limit = len(text)
+    for start, end, replacement in replacements:
+        if end > limit:
+            return None
+
+        text = text[:start] + replacement + text[end:]
+        limit = start
+
+    return text
+
+
+def _walk_nodes(node: yaml.Node) -> Iterable[yaml.Node]:
+    stack = [node]
+    visited = set()
+    while stack:
+        node = stack.pop()
+        yield node
+        if id(node) in visited:
+            continue
+
+        visited.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                stack.append(key_node)
+                stack.append(value_node)
+
+        elif isinstance(node, yaml.SequenceNode):
+            stack.extend(node.value)
+
+
+def _find_yaml_node(node: yaml.Node, path: KeyPath) -> Optional[yaml.Node]:
+    for sub_key in path:
+        if not isinstance(node, yaml.MappingNode):
+            return None
+
+        for key_node, value_node in node.value:
+            if key_node.tag == _YAML_STR_TAG and key_node.value == sub_key:
+                node = value_node
+                break
+
+        else:
+            return None
+
+    return node
+
+
+def _yaml_scalar(value: Any) -> str:
+    # Scalar written inside of flow sequence is valid anywhere
+    flow = yaml.safe_dump(
+        [value], default_flow_style=True,
+        width=float("inf"), allow_unicode=True  # type: ignore
+    )
+    return flow.strip()[1:-1]
+
+
+def patch_toml(text: str, changes: Dict[KeyPath, Any]) -> Optional[str]:
+    """
+    Applies changes to toml document through tomlkit,
+    keeping comments and layout of everything else.
+
+    :param text: current content of file.
+    :param changes: paths mapped to their new values.
+    :return: new content of file or None if tomlkit isn't installed
+        or structure changed and document must be written from scratch.
+    """
+    if tomlkit is None:
+        return None
+
+    try:
+        document = tomlkit.parse(text)
+
+    except Exception:
+        return None
+
+    for path, value in changes.items():
+        container: Any = document
+        for sub_key in path[:-1]:
+            container = container.get(sub_key)
+            if not isinstance(container, dict):
+                return None
+
+        if path[-1] not in container:
+            return None
+
+        if value is MISSING:
+            del container[path[-1]]
+
+        else:
+            container[path[-1]] = value
+
+    return tomlkit.dumps(document)
@@ -1,29 +1,60 @@
-import json
+import io
 from functools import partial
 from os import PathLike
 from pathlib import Path
-from typing import Union, Optional, MutableMapping, Any, Callable
+from typing import (
+    Union, Optional, MutableMapping, Any, Callable, Iterable, Tuple
+)
 
+from config_framework.loaders.file_io import (
+    DEFAULT_MMAP_THRESHOLD, open_buffer, is_utf8,
+    write_if_changed, write_text_if_changed
+)
+from config_framework.loaders.json_backends import (
+    JsonBackend, STDLIB_BACKEND, get_backend
+)
+from config_framework.loaders.parsed_cache import (
+    ParsedDocument, read_cached
+)
+from config_framework.loaders.subtree_parsing import (
+    KeyTrie, build_key_trie, prune, select_json
+)
 from config_framework.types.abstract import AbstractLoader
+from config_framework.types.lazy_mapping import LazyMapping
+from config_framework.types.variable_key import KeyLike, KeyPath, compile_key
 
 
 class Json(AbstractLoader):
     path: Union[PathLike, Path]
     encoding: str
-    json_loader: Callable
-    json_dumper: Callable
+    json_loader: Optional[Callable]
+    json_dumper: Optional[Callable]
+    backend: JsonBackend
+    dump_backend: JsonBackend
+    compact: bool
+    is_partial: bool
 
     def __init__(
         self, data: MutableMapping[str, Any],
         defaults: MutableMapping[str, Any],
         path: Union[PathLike, Path],
         encoding: str,
-        json_loader: Callable,
-        json_dumper: Callable
+        json_loader: Optional[Callable],
+        json_dumper: Optional[Callable],
+        backend: Optional[JsonBackend] = None,
+        compact: bool = False,
+        is_partial: bool = False,
+        dump_backend: Optional[JsonBackend] = None
     ):
         super().__init__(data, defaults)
         self.path = path
         self.encoding = encoding
+        self.backend = get_backend(backend)
+        self.dump_backend = (
+            self.backend if dump_backend is None else dump_backend
+        )
+        self.compact = compact
+        self.is_partial = is_partial
         setattr(self, "json_loader", json_loader)
         setattr(self, "json_dumper", json_dumper)
 
@@ -32,8 +63,15 @@ class Json(AbstractLoader):
         cls, path: Union[PathLike, Path],
         defaults: Optional[MutableMapping[str, Any]] = None,
         encoding: str = "utf8",
-        json_loader=json.load,
-        json_dumper=partial(json.dump, ensure_ascii=False, indent=4),
+        json_loader: Optional[Callable] = None,
+        json_dumper: Optional[Callable] = None,
+        flat_index: bool = False,
+        lazy: bool = False,
+        backend: Union[str, JsonBackend, None] = None,
+        compact: bool = False,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        cached: bool = False,
+        only_keys: Optional[Iterable[KeyLike]] = None
     ):
         """
         Loads json file from path into loader.
@@ -41,23 +79,121 @@ class Json(AbstractLoader):
         :param path: where file with json is located.
         :param defaults: default values.
         :param encoding: which encoding does config file has (defaults to utf-8).
-        :param json_loader: function that loads json file.
-        :param json_dumper: function that dumps to json file.
+        :param json_loader: function that loads json from text file object,
+            replaces backend for reading if specified.
+        :param json_dumper: function that dumps to json text file object,
+            replaces backend for writing if specified.
+        :param flat_index: index every value by its full path at load time.
+        :param lazy: read and parse file only when data is accessed first time.
+        :param backend: name of json library (orjson, simdjson, ujson or json)
+            that parses raw bytes of file and dumps data, or "fastest" to
+            parse with the fastest installed one and dump with json module,
+            so output doesn't depend on installed libraries. json module
+            is used if not specified.
+        :param compact: dump json without indentation.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :param cached: share parsed file with other loaders reading it
+            with same settings through process-wide cache.
+        :param only_keys: keys of values that must be loaded, everything
+            else in file is skipped. Such loader can't be dumped.
         :return: instance of json loader.
         """
-        with open(path, encoding=encoding) as data_f:
-            data = json_loader(data_f)
+        json_backend = get_backend(backend)
+        selected_paths: Optional[Tuple[KeyPath, ...]] = None
+        if only_keys is not None:
+            selected_paths = tuple(sorted(set(map(compile_key, only_keys))))
+
+        read: Callable[[], ParsedDocument] = partial(
+            cls._read_file, path, encoding,
+            json_loader, json_backend, mmap_threshold,
+            None if selected_paths is None else build_key_trie(selected_paths)
+        )
+        if cached:
+            read = partial(
+                read_cached, path, read,
+                (cls, encoding, json_loader, json_backend.name, selected_paths)
+            )
 
-        return cls(
+        # Empty files give None
+        data = LazyMapping(read) if lazy else (read() or {})
+
+        loader = cls(
             data=data, defaults=defaults or {},
             path=path, encoding=encoding,
-            json_loader=json_loader, json_dumper=json_dumper
+            json_loader=json_loader, json_dumper=json_dumper,
+            backend=json_backend, compact=compact,
+            is_partial=selected_paths is not None,
+            dump_backend=STDLIB_BACKEND if backend == "fastest" else json_backend
         )
+        if flat_index:
+            loader.enable_flat_index()
+
+        return loader
+
+    @staticmethod
+    def _read_file(
+        path: Union[PathLike, Path], encoding: str,
+        json_loader: Optional[Callable], backend: JsonBackend,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        only_keys: Optional[KeyTrie] = None
+    ) -> MutableMapping[str, Any]:
+        """
+        Reads and parses json file.
+
+        :param path: where file with json is located.
+        :param encoding: which encoding does config file has.
+        :param json_loader: function that loads json file or None
+            to parse raw bytes with backend.
+        :param backend: json library used if there's no json_loader.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :param only_keys: keys that must be parsed or None to parse all.
+        :return: parsed data.
+        """
+        if json_loader is not None:
+            with open(path, encoding=encoding) as data_f:
+                data = json_loader(data_f)
+
+            return data if only_keys is None else prune(data, only_keys)
+
+        with open_buffer(path, mmap_threshold) as buffer:
+            if only_keys is not None:
+                if not is_utf8(encoding):
+                    # Scanner works with utf-8, like json files usually are
+                    buffer = bytes(buffer).decode(encoding).encode("utf8")
+
+                return select_json(buffer, only_keys, backend.loads)
+
+            if not is_utf8(encoding):
+                return backend.loads(bytes(buffer).decode(encoding))
+
+            if isinstance(buffer, bytes):
+                return backend.loads(buffer)
+
+            if backend.accepts_buffer:
+                with memoryview(buffer) as view:
+                    return backend.loads(view)
+
+            return backend.loads(buffer[:])
 
     def dump(self, include_defaults: bool = False) -> None:
-        to_dump = self.data
-        if include_defaults:
-            to_dump = dict(self.lookup_data)
+        if self.is_partial:
+            raise RuntimeError(
+                "Loader has only selected keys of file loaded "
+                "and can't be dumped."
+            )
+
+        to_dump = self._dump_data(include_defaults)
+
+        if self.json_dumper is not None:
+            stream = io.StringIO()
+            self.json_dumper(to_dump, stream)
+            write_text_if_changed(self.path, stream.getvalue(), self.encoding)
+            return
+
+        raw_data = self.dump_backend.dumps(to_dump, self.compact)
+        if not is_utf8(self.encoding):
+            raw_data = raw_data.decode("utf8").encode(self.encoding)
 
-        with open(self.path, 'w', encoding=self.encoding) as json_f:
-            self.json_dumper(to_dump, json_f)
+        write_if_changed(self.path, raw_data)
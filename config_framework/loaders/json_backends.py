@@ -0,0 +1,109 @@
+import json
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+
+class JsonBackend(NamedTuple):
+    """
+    Library that is used for parsing and serializing json.
+
+    loads must accept bytes or str and dumps must return utf-8 encoded
+    bytes, producing indented output unless compact is requested.
+    If accepts_buffer is set, loads also accepts memoryview.
+    """
+    name: str
+    loads: Callable[[Any], Any]
+    dumps: Callable[[Any, bool], bytes]
+    accepts_buffer: bool = False
+
+
+def _json_dumps(data: Any, compact: bool) -> bytes:
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=4)
+
+    return text.encode("utf8")
+
+
+STDLIB_BACKEND = JsonBackend("json", json.loads, _json_dumps)
+# Ordered from the fastest one
+available_backends: Dict[str, JsonBackend] = {}
+
+try:
+    import orjson
+
+    def _orjson_dumps(data: Any, compact: bool) -> bytes:
+        # Non str keys are converted to strings like json module does,
+        # but orjson supports only two spaces indentation
+        if compact:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+        return orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+
+    available_backends["orjson"] = JsonBackend(
+        "orjson", orjson.loads, _orjson_dumps, accepts_buffer=True
+    )
+
+except ImportError:
+    pass
+
+try:
+    import simdjson  # type: ignore
+
+    # simdjson only parses, so stdlib is used for writing
+    available_backends["simdjson"] = JsonBackend(
+        "simdjson", simdjson.loads, _json_dumps
+    )
+
+except ImportError:
+    pass
+
+try:
+    import ujson  # type: ignore
+
+    def _ujson_dumps(data: Any, compact: bool) -> bytes:
+        text = ujson.dumps(data, ensure_ascii=False, indent=0 if compact else 4)
+        return text.encode("utf8")
+
+    available_backends["ujson"] = JsonBackend(
+        "ujson", ujson.loads, _ujson_dumps
+    )
+
+except ImportError:
+    pass
+
+available_backends[STDLIB_BACKEND.name] = STDLIB_BACKEND
+
+
+def get_backend(
+    backend: Union[str, JsonBackend, None] = None
+) -> JsonBackend:
+    """
+    Gives json backend.
+
+    :param backend: name of backend, backend itself, "fastest" to pick
+        the fastest one installed or None for json module. Other libraries
+        may reject documents json module accepts, like NaN or big integers.
+    :return: json backend.
+    :raises ValueError: if requested backend isn't installed.
+    """
+    if isinstance(backend, JsonBackend):
+        return backend
+
+    if backend is None:
+        return STDLIB_BACKEND
+
+    if backend == "fastest":
+        return next(iter(available_backends.values()))
+
+    selected: Optional[JsonBackend] = available_backends.get(backend)
+    if selected is None:
+        raise ValueError(
+            f"Json backend {backend} isn't installed, available ones are: "
+            f"{', '.join(available_backends)}"
+        )
+
+    return selected
@@ -0,0 +1,171 @@
+import copy
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from os import PathLike
+from pathlib import Path
+from typing import (
+    Any, Callable, Hashable, MutableMapping, NamedTuple, Optional, Tuple, Union
+)
+
+FileKey = Tuple[str, int, int, int, Hashable]
+ParsedDocument = Optional[MutableMapping[str, Any]]
+
+
+class ParsedFileCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    size: int
+
+
+class _CachedDocument(NamedTuple):
+    # Either marshalled document or document itself if it has values
+    # marshal can't handle, that is deep copied instead
+    payload: Any
+    is_marshalled: bool
+    size: int
+
+    @classmethod
+    def from_document(
+        cls, document: ParsedDocument, size: int
+    ) -> "_CachedDocument":
+        # marshal handles only plain dicts, None included
+        if not isinstance(document, dict):
+            return cls(copy.deepcopy(document), False, size)
+
+        try:
+            return cls(marshal.dumps(document), True, size)
+
+        except ValueError:
+            return cls(copy.deepcopy(document), False, size)
+
+    def copy(self) -> ParsedDocument:
+        if self.is_marshalled:
+            return marshal.loads(self.payload)
+
+        return copy.deepcopy(self.payload)
+
+
+class ParsedFileCache:
+    """
+    Process-wide cache of parsed files, shared between loaders that read
+    same file with same parser. Files are identified by real path, inode,
+    modification time and size, so changed file is parsed again.
+
+    Every loader gets its own copy of document, so changing data of one
+    loader doesn't affect others. Least recently used documents are
+    dropped when there's more than max_entries of them or when total size
+    of their files is bigger than max_size.
+    """
+    def __init__(self, max_entries: int = 128, max_size: int = 64 * 1024 * 1024):
+        """
+        :param max_entries: how many documents can be cached at most.
+        :param max_size: total size in bytes of files that can be cached.
+        :return: nothing.
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._documents: "OrderedDict[FileKey, _CachedDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(
+        self, path: Union[PathLike, Path, str],
+        parse: Callable[[], ParsedDocument],
+        fingerprint: Hashable
+    ) -> ParsedDocument:
+        """
+        Gives copy of parsed file, parsing it if it isn't cached.
+
+        :param path: path to file.
+        :param parse: function that reads and parses file.
+        :param fingerprint: anything identifying parser and its settings.
+        :return: parsed document.
+        """
+        stat = os.stat(path)
+        key: FileKey = (
+            os.path.realpath(path), stat.st_ino,
+            stat.st_mtime_ns, stat.st_size, fingerprint
+        )
+        try:
+            with self._lock:
+                cached = self._documents.get(key)
+                if cached is not None:
+                    self._documents.move_to_end(key)
+                    self.hits += 1
+
+        except TypeError:
+            # Parser settings that can't be hashed can't be cached
+            return parse()
+
+        if cached is not None:
+            return cached.copy()
+
+        document = parse()
+        if stat.st_size > self.max_size:
+            return document
+
+        cached = _CachedDocument.from_document(document, stat.st_size)
+        with self._lock:
+            self.misses += 1
+            previous = self._documents.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._documents[key] = cached
+            self._size += cached.size
+            self._evict()
+
+        return cached.copy()
+
+    def _evict(self) -> None:
+        while self._documents and (
+            len(self._documents) > self.max_entries
+            or self._size > self.max_size
+        ):
+            _, evicted = self._documents.popitem(last=False)
+            self._size -= evicted.size
+
+    def clear(self) -> None:
+        """
+        Drops all cached documents.
+
+        :return: nothing.
+        """
+        with self._lock:
+            self._documents.clear()
+            self._size = 0
+
+    def stats(self) -> ParsedFileCacheStats:
+        """
+        Gives statistics of cache usage.
+
+        :return: hits, misses, number of documents and their files size.
+        """
+        return ParsedFileCacheStats(
+            self.hits, self.misses, len(self._documents), self._size
+        )
+
+
+parsed_files_cache = ParsedFileCache()
+
+
+def read_cached(
+    path: Union[PathLike, Path, str],
+    parse: Callable[[], ParsedDocument],
+    fingerprint: Hashable
+) -> ParsedDocument:
+    """
+    Gives copy of parsed file from process-wide cache.
+    Module level function, so loaders reading with it can be pickled.
+
+    :param path: path to file.
+    :param parse: function that reads and parses file.
+    :param fingerprint: anything identifying parser and its settings.
+    :return: parsed document.
+    """
+    return parsed_files_cache.get_or_parse(path, parse, fingerprint)
@@ -0,0 +1,241 @@
+import json
+import re
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from typing import Any, Callable, Dict, Iterable, Optional, Pattern, Tuple
+
+import yaml
+
+from config_framework.types.variable_key import KeyLike, KeyPath, compile_key
+
+# Every level maps key to its sub-level, or to None if whole value is needed
+KeyTrie = Dict[str, Optional["KeyTrie"]]
+
+# Json is scanned as utf-8 bytes, so file doesn't have to be decoded
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+# Matches rest of string after opening quote
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\]\s]*")
+# Matches everything but brackets, including whole strings with brackets
+_FLAT_RUN = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+_YAML_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+def _skip(pattern: Pattern[bytes], buffer: Any, index: int) -> int:
+    # Patterns used with it match empty string, so they never fail
+    match = pattern.match(buffer, index)
+    assert match is not None
+    return match.end()
+
+
+def _decode_error(message: str, buffer: Any, index: int) -> json.JSONDecodeError:
+    # Only text before error is decoded to tell where it is
+    before = bytes(buffer[:index]).decode("utf8", "replace")
+    return json.JSONDecodeError(message, before, len(before))
+
+
+def build_key_trie(keys: Iterable[KeyLike]) -> KeyTrie:
+    """
+    Groups keys by their common parts.
+
+    :param keys: keys that must be kept.
+    :return: tree of key pieces.
+    """
+    trie: KeyTrie = {}
+    for key in keys:
+        path: KeyPath = compile_key(key)
+        level = trie
+        for piece in path[:-1]:
+            sub_level = level.setdefault(piece, {})
+            if sub_level is None:
+                # Whole parent is already needed
+                break
+
+            level = sub_level
+
+        else:
+            if path:
+                level[path[-1]] = None
+
+    return trie
+
+
+def prune(document: Any, trie: KeyTrie) -> Dict[str, Any]:
+    """
+    Gives copy of already parsed document containing only selected keys.
+
+    :param document: parsed document.
+    :param trie: keys that must be kept.
+    :return: document with only selected keys.
+    """
+    selected: Dict[str, Any] = {}
+    if not isinstance(document, dict):
+        return selected
+
+    for key, sub_trie in trie.items():
+        if key not in document:
+            continue
+
+        if sub_trie is None:
+            selected[key] = document[key]
+
+        elif isinstance(document[key], dict):
+            selected[key] = prune(document[key], sub_trie)
+
+    return selected
+
+
+def select_json(
+    buffer: Any, trie: KeyTrie, loads: Callable[[bytes], Any] = json.loads
+) -> Dict[str, Any]:
+    """
+    Parses only selected parts of json document. Values that aren't
+    selected are skipped without being decoded or parsed, and so
+    aren't validated.
+
+    :param buffer: utf-8 encoded json document, bytes or memory map.
+    :param trie: keys that must be parsed.
+    :param loads: function that parses bytes of selected values.
+    :return: document with only selected keys.
+    :raises json.JSONDecodeError: if document is invalid.
+    """
+    index = _skip(_WHITESPACE, buffer, 0)
+    selected, _ = _select_json_value(buffer, index, trie, loads)
+    return selected if isinstance(selected, dict) else {}
+
+
+def _select_json_value(
+    buffer: Any, index: int, trie: KeyTrie, loads: Callable[[bytes], Any]
+) -> Tuple[Optional[Dict[str, Any]], int]:
+    if buffer[index:index + 1] != b"{":
+        # Nothing can be selected from anything but object
+        return None, _skip_json_value(buffer, index)
+
+    selected: Dict[str, Any] = {}
+    index = _skip(_WHITESPACE, buffer, index + 1)
+    if buffer[index:index + 1] == b"}":
+        return selected, index + 1
+
+    while True:
+        if buffer[index:index + 1] != b'"':
+            raise _decode_error("Expecting property name", buffer, index)
+
+        end = _skip_json_string(buffer, index + 1)
+        key, _ = scanstring(bytes(buffer[index + 1:end]).decode("utf8"), 0)
+        index = _skip(_WHITESPACE, buffer, end)
+        if buffer[index:index + 1] != b":":
+            raise _decode_error("Expecting ':' delimiter", buffer, index)
+
+        index = _skip(_WHITESPACE, buffer, index + 1)
+        if key in trie:
+            sub_trie = trie[key]
+            if sub_trie is None:
+                end = _skip_json_value(buffer, index)
+                selected[key] = loads(bytes(buffer[index:end]))
+
+            else:
+                value, end = _select_json_value(buffer, index, sub_trie, loads)
+                if value is not None:
+                    selected[key] = value
+
+        else:
+            end = _skip_json_value(buffer, index)
+
+        index = _skip(_WHITESPACE, buffer, end)
+        delimiter = buffer[index:index + 1]
+        index = _skip(_WHITESPACE, buffer, index + 1)
+        if delimiter == b"}":
+            return selected, index
+
+        if delimiter != b",":
+            raise _decode_error("Expecting ',' delimiter", buffer, index)
+
+
+def _skip_json_value(buffer: Any, index: int) -> int:
+    char = buffer[index:index + 1]
+    if char == b'"':
+        return _skip_json_string(buffer, index + 1)
+
+    if char not in (b"{", b"["):
+        end = _skip(_SCALAR, buffer, index)
+        if end == index:
+            raise _decode_error("Expecting value", buffer, index)
+
+        return end
+
+    depth = 0
+    position = index
+    while True:
+        # Only brackets are looked at one by one
+        position = _skip(_FLAT_RUN, buffer, position)
+        char = buffer[position:position + 1]
+        if char in (b"{", b"["):
+            depth += 1
+
+        elif char in (b"}", b"]"):
+            depth -= 1
+
+        else:
+            raise _decode_error("Unterminated container", buffer, index)
+
+        position += 1
+        if depth == 0:
+            return position
+
+
+def _skip_json_string(buffer: Any, index: int) -> int:
+    match = _STRING_END.match(buffer, index)
+    if match is None:
+        raise _decode_error("Unterminated string", buffer, index - 1)
+
+    return match.end()
+
+
+def select_yaml(stream: Any, trie: KeyTrie, loader_cls: type) -> Dict[str, Any]:
+    """
+    Parses only selected parts of yaml document. Whole document is
+    composed into nodes, but only selected ones are turned into values.
+
+    :param stream: text, bytes or file-like object with yaml document.
+    :param trie: keys that must be parsed.
+    :param loader_cls: yaml loader class, like yaml.SafeLoader.
+    :return: document with only selected keys.
+    """
+    loader = loader_cls(stream)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return {}
+
+        selected = _select_yaml_node(loader, node, trie)
+        return selected if selected is not None else {}
+
+    finally:
+        loader.dispose()
+
+
+def _select_yaml_node(
+    loader: Any, node: yaml.Node, trie: KeyTrie
+) -> Optional[Dict[str, Any]]:
+    if not isinstance(node, yaml.MappingNode):
+        return None
+
+    if any(key_node.tag == _YAML_MERGE_TAG for key_node, _ in node.value):
+        # Merged keys are resolved only by constructing whole mapping
+        return prune(loader.construct_document(node), trie)
+
+    selected: Dict[str, Any] = {}
+    for key_node, value_node in node.value:
+        if key_node.tag != _YAML_STR_TAG or key_node.value not in trie:
+            continue
+
+        sub_trie = trie[key_node.value]
+        if sub_trie is None:
+            selected[key_node.value] = loader.construct_document(value_node)
+            continue
+
+        value = _select_yaml_node(loader, value_node, sub_trie)
+        if value is not None:
+            selected[key_node.value] = value
+
+    return selected
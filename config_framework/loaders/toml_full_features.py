@@ -1,3 +1,4 @@
+import io
 from functools import partial
 from os import PathLike
 from pathlib import Path
@@ -5,7 +6,20 @@ from typing import Union, Optional, MutableMapping, Any, Callable, Dict
 
 import toml as toml_loader_lib
 
+from config_framework.loaders.compiled_cache import (
+    describe_parser, read_compiled, resolve_cache_dir
+)
+from config_framework.loaders.file_io import (
+    DEFAULT_MMAP_THRESHOLD, open_buffer, write_text_if_changed
+)
+from config_framework.loaders.format_preserving import (
+    collect_changes, patch_toml
+)
+from config_framework.loaders.parsed_cache import (
+    ParsedDocument, read_cached
+)
 from config_framework.loaders.toml_read_only import TomlReadOnly
+from config_framework.types.lazy_mapping import LazyMapping
 
 
 class Toml(TomlReadOnly):
@@ -13,6 +27,7 @@ class Toml(TomlReadOnly):
     encoding: str
     toml_loader: Callable
     toml_dumper: Callable
+    preserve_format: bool
 
     def __init__(
         self, data: MutableMapping[str, Any],
@@ -20,9 +35,11 @@ class Toml(TomlReadOnly):
         path: Union[PathLike, Path],
         encoding: str,
         toml_loader: Callable,
-        toml_dumper: Callable
+        toml_dumper: Callable,
+        preserve_format: bool = False
     ):
         super().__init__(data, defaults, path, encoding, toml_loader, toml_dumper)
+        self.preserve_format = preserve_format
 
     @classmethod
     def load(
@@ -31,6 +48,12 @@ class Toml(TomlReadOnly):
         loader_kwargs: Optional[Dict[Any, Any]] = None,
         dumper_kwargs: Optional[Dict[Any, Any]] = None,
         encoding: str = "utf8",
+        flat_index: bool = False,
+        lazy: bool = False,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        cached: bool = False,
+        compiled_cache: Union[bool, PathLike, Path, str] = False,
+        preserve_format: bool = False
     ):
         """
         Initializes loader for read only toml.
@@ -40,28 +63,139 @@ class Toml(TomlReadOnly):
         :param loader_kwargs: used for specifying parameters, according to toml documentation of `toml.load` function.
         :param dumper_kwargs: used for specifying parameters, according to toml documentation of `toml.dump` function.
         :param encoding: which encoding should be used for a file.
+        :param flat_index: index every value by its full path at load time.
+        :param lazy: read and parse file only when data is accessed first time.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :param cached: share parsed file with other loaders reading it
+            with same settings through process-wide cache.
+        :param compiled_cache: True to keep marshalled parse results
+            next to file, or directory to keep them in, so unchanged file
+            isn't parsed again by next processes.
+        :param preserve_format: on dump change only modified values through
+            tomlkit (installed with toml extra), keeping comments
+            and layout of file.
         :return: instance of TomlReadOnly class.
         """
-        with open(path, encoding=encoding) as data_f:
-            data = toml_loader_lib.load(data_f)
-
         if loader_kwargs is None:
             loader_kwargs = dict()
 
         if dumper_kwargs is None:
             dumper_kwargs = dict()
 
-        return cls(
+        toml_loader = partial(toml_loader_lib.load, **loader_kwargs)
+        # File is decoded once and parsed from text
+        toml_text_loader = partial(toml_loader_lib.loads, **loader_kwargs)
+        read: Callable[[], ParsedDocument] = partial(
+            cls._read_file, path, encoding, toml_text_loader, mmap_threshold
+        )
+        cache_dir = resolve_cache_dir(path, compiled_cache)
+        if cache_dir is not None:
+            fingerprint = (
+                f"{describe_parser(cls)}:{getattr(toml_loader_lib, '__version__', '')}:"
+                f"{describe_parser(toml_text_loader)}:{encoding}"
+            )
+            read = partial(
+                read_compiled, path,
+                partial(
+                    cls._parse_text, encoding=encoding,
+                    toml_loader=toml_text_loader
+                ),
+                fingerprint, cache_dir, mmap_threshold
+            )
+
+        if cached:
+            read = partial(
+                read_cached, path, read,
+                (cls, encoding, tuple(sorted(loader_kwargs.items())))
+            )
+
+        # Empty files give None
+        data = LazyMapping(read) if lazy else (read() or {})
+
+        loader = cls(
             data=data, defaults=defaults or {},
             path=path, encoding=encoding,
-            toml_loader=partial(toml_loader_lib.load, **loader_kwargs),
-            toml_dumper=partial(toml_loader_lib.dump, **dumper_kwargs)
+            toml_loader=toml_loader,
+            toml_dumper=partial(toml_loader_lib.dump, **dumper_kwargs),
+            preserve_format=preserve_format
         )
+        if flat_index:
+            loader.enable_flat_index()
+
+        return loader
+
+    @staticmethod
+    def _read_file(
+        path: Union[PathLike, Path], encoding: str, toml_loader: Callable,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+    ) -> MutableMapping[str, Any]:
+        """
+        Reads and parses toml file.
+
+        :param path: path that is used to load config.
+        :param encoding: which encoding should be used for a file.
+        :param toml_loader: function that parses toml text.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :return: parsed data.
+        """
+        with open_buffer(path, mmap_threshold) as buffer:
+            return Toml._parse_text(buffer, encoding, toml_loader)
+
+    @staticmethod
+    def _parse_text(
+        buffer: Any, encoding: str, toml_loader: Callable
+    ) -> MutableMapping[str, Any]:
+        """
+        Parses content of toml file.
+
+        :param buffer: bytes or memory map with content of file.
+        :param encoding: which encoding should be used for a file.
+        :param toml_loader: function that parses toml text.
+        :return: parsed data.
+        """
+        # toml library parses only text, buffer is decoded without copying
+        return toml_loader(str(buffer, encoding))
 
     def dump(self, include_defaults: bool = False) -> None:
-        to_dump = self.data
-        if include_defaults:
-            to_dump = dict(self.lookup_data)
+        to_dump = self._dump_data(include_defaults)
+        if (
+            self.preserve_format and not include_defaults
+            and self._dump_changes(to_dump)
+        ):
+            return
+
+        stream = io.StringIO()
+        self.toml_dumper(to_dump, stream)
+        write_text_if_changed(self.path, stream.getvalue(), self.encoding)
+
+    def _dump_changes(self, to_dump: MutableMapping[str, Any]) -> bool:
+        """
+        Rewrites only values changed since last dump.
+
+        :param to_dump: data that must be in file.
+        :return: False if whole file must be written instead.
+        """
+        modified_paths = self._modified_paths
+        if modified_paths is None:
+            return False
+
+        try:
+            with open(self.path, encoding=self.encoding) as toml_f:
+                text = toml_f.read()
+
+        except OSError:
+            return False
+
+        patched = patch_toml(
+            text, collect_changes(to_dump, modified_paths)
+        )
+        # Anything changed not through loader must be written as well
+        if patched is None or toml_loader_lib.loads(patched) != to_dump:
+            return False
+
+        if patched != text:
+            write_text_if_changed(self.path, patched, self.encoding)
 
-        with open(self.path, 'w', encoding=self.encoding) as json_f:
-            self.toml_dumper(to_dump, json_f)
+        return True
@@ -1,10 +1,26 @@
 import tomllib as toml_loader_lib
 from functools import partial
+from io import BytesIO
 from os import PathLike
 from pathlib import Path
 from typing import Union, Optional, MutableMapping, Any, Callable, Dict
 
+from config_framework.loaders.compiled_cache import (
+    describe_parser, read_compiled, resolve_cache_dir
+)
+from config_framework.loaders.file_io import (
+    DEFAULT_MMAP_THRESHOLD, open_buffer
+)
+from config_framework.loaders.parsed_cache import (
+    ParsedDocument, read_cached
+)
 from config_framework.types.abstract import AbstractLoader
+from config_framework.types.lazy_mapping import LazyMapping
+
+
+def _dump_not_supported(*args, **kwargs) -> None:
+    # Module level function instead of lambda, so loader can be pickled
+    return None
 
 
 class TomlReadOnly(AbstractLoader):
@@ -34,6 +50,11 @@ class TomlReadOnly(AbstractLoader):
         loader_kwargs: Optional[Dict[Any, Any]] = None,
         dumper_kwargs: Optional[Dict[Any, Any]] = None,
         encoding: str = "utf8",
+        flat_index: bool = False,
+        lazy: bool = False,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        cached: bool = False,
+        compiled_cache: Union[bool, PathLike, Path, str] = False
     ):
         """
         Initializes loader for read only toml.
@@ -45,21 +66,91 @@ class TomlReadOnly(AbstractLoader):
 
         :param dumper_kwargs: not used.
         :param encoding: which encoding should be used for a file.
+        :param flat_index: index every value by its full path at load time.
+        :param lazy: read and parse file only when data is accessed first time.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :param cached: share parsed file with other loaders reading it
+            with same settings through process-wide cache.
+        :param compiled_cache: True to keep marshalled parse results
+            next to file, or directory to keep them in, so unchanged file
+            isn't parsed again by next processes.
 
         :return: instance of TomlReadOnly class.
         """
-        with open(path, encoding=encoding, mode="b") as data_f:
-            data = toml_loader_lib.load(data_f)
-
         if loader_kwargs is None:
             loader_kwargs = dict()
 
-        return cls(
+        toml_loader = partial(toml_loader_lib.load, **loader_kwargs)
+        read: Callable[[], ParsedDocument] = partial(
+            cls._read_file, path, encoding, toml_loader, mmap_threshold
+        )
+        cache_dir = resolve_cache_dir(path, compiled_cache)
+        if cache_dir is not None:
+            fingerprint = (
+                f"{describe_parser(cls)}:{describe_parser(toml_loader)}"
+            )
+            read = partial(
+                read_compiled, path,
+                partial(cls._parse_buffer, toml_loader=toml_loader),
+                fingerprint, cache_dir, mmap_threshold
+            )
+
+        if cached:
+            read = partial(
+                read_cached, path, read,
+                (cls, tuple(sorted(loader_kwargs.items())))
+            )
+
+        # Empty files give None
+        data = LazyMapping(read) if lazy else (read() or {})
+
+        loader = cls(
             data=data, defaults=defaults or {},
             path=path, encoding=encoding,
-            toml_loader=partial(toml_loader_lib.load, **loader_kwargs),
-            toml_dumper=lambda *args, **kwargs: None  # it doesn't work for this class
+            toml_loader=toml_loader,
+            toml_dumper=_dump_not_supported  # it doesn't work for this class
         )
+        if flat_index:
+            loader.enable_flat_index()
+
+        return loader
+
+    @staticmethod
+    def _read_file(
+        path: Union[PathLike, Path], encoding: str, toml_loader: Callable,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+    ) -> MutableMapping[str, Any]:
+        """
+        Reads and parses toml file.
+
+        :param path: path that is used to load config.
+        :param encoding: not used, since tomllib reads binary files.
+        :param toml_loader: function that loads toml file.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :return: parsed data.
+        """
+        with open_buffer(path, mmap_threshold) as buffer:
+            return TomlReadOnly._parse_buffer(buffer, toml_loader)
+
+    @staticmethod
+    def _parse_buffer(
+        buffer: Any, toml_loader: Callable
+    ) -> MutableMapping[str, Any]:
+        """
+        Parses content of toml file.
+
+        :param buffer: bytes or memory map with content of file.
+        :param toml_loader: function that loads toml file.
+        :return: parsed data.
+        """
+        if isinstance(buffer, bytes):
+            return toml_loader(BytesIO(buffer))
+
+        # Memory map is file-like itself
+        buffer.seek(0)
+        return toml_loader(buffer)
 
     def dump(self, include_defaults: bool = False) -> None:
         raise RuntimeError(
@@ -1,10 +1,31 @@
+import codecs
+import io
 import yaml
 from functools import partial
 from os import PathLike
 from pathlib import Path
-from typing import Union, Optional, MutableMapping, Any, Callable
+from typing import (
+    Union, Optional, MutableMapping, Any, Callable, Iterable, Tuple
+)
 
+from config_framework.loaders.compiled_cache import (
+    describe_parser, read_compiled, resolve_cache_dir
+)
+from config_framework.loaders.file_io import (
+    DEFAULT_MMAP_THRESHOLD, open_buffer, is_utf8, write_text_if_changed
+)
+from config_framework.loaders.format_preserving import (
+    collect_changes, patch_yaml
+)
+from config_framework.loaders.parsed_cache import (
+    ParsedDocument, read_cached
+)
+from config_framework.loaders.subtree_parsing import (
+    KeyTrie, build_key_trie, prune, select_yaml
+)
 from config_framework.types.abstract import AbstractLoader
+from config_framework.types.lazy_mapping import LazyMapping
+from config_framework.types.variable_key import KeyLike, KeyPath, compile_key
 
 try:
     from yaml import CLoader as Loader, CDumper as Dumper
@@ -20,6 +41,8 @@ class Yaml(AbstractLoader):
     encoding: str
     yaml_loader: Callable
     yaml_dumper: Callable
+    is_partial: bool
+    preserve_format: bool
 
     def __init__(
         self, data: MutableMapping[str, Any],
@@ -27,11 +50,15 @@ class Yaml(AbstractLoader):
         path: Union[PathLike, Path],
         encoding: str,
         yaml_loader: Callable,
-        yaml_dumper: Callable
+        yaml_dumper: Callable,
+        is_partial: bool = False,
+        preserve_format: bool = False
     ):
         super().__init__(data, defaults)
         self.path = path
         self.encoding = encoding
+        self.is_partial = is_partial
+        self.preserve_format = preserve_format
         setattr(self, "yaml_loader", yaml_loader)
         setattr(self, "yaml_dumper", yaml_dumper)
 
@@ -42,6 +69,13 @@ class Yaml(AbstractLoader):
         encoding: str = "utf8",
         yaml_loader=partial(yaml.load, Loader=Loader),
         yaml_dumper=partial(yaml.dump, Dumper=Dumper),
+        flat_index: bool = False,
+        lazy: bool = False,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        cached: bool = False,
+        compiled_cache: Union[bool, PathLike, Path, str] = False,
+        only_keys: Optional[Iterable[KeyLike]] = None,
+        preserve_format: bool = False
     ):
         """
         Loads yaml from file.
@@ -51,22 +85,205 @@ class Yaml(AbstractLoader):
         :param encoding: which encoding does config file has (defaults to utf-8).
         :param yaml_loader: function that is used for loading data from file.
         :param yaml_dumper: function that is used for saving data to file.
+        :param flat_index: index every value by its full path at load time.
+        :param lazy: read and parse file only when data is accessed first time.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :param cached: share parsed file with other loaders reading it
+            with same settings through process-wide cache.
+        :param compiled_cache: True to keep marshalled parse results
+            next to file, or directory to keep them in, so unchanged file
+            isn't parsed again by next processes.
+        :param only_keys: keys of values that must be loaded, everything
+            else in file is skipped. Such loader can't be dumped.
+        :param preserve_format: on dump replace only text of changed
+            values, keeping comments and layout of file.
         :return: instance of yaml loader.
         """
-        with open(path, encoding=encoding) as data_f:
-            data = yaml_loader(data_f)
+        selected_paths: Optional[Tuple[KeyPath, ...]] = None
+        if only_keys is not None:
+            selected_paths = tuple(sorted(set(map(compile_key, only_keys))))
 
-        return cls(
+        key_trie = (
+            None if selected_paths is None else build_key_trie(selected_paths)
+        )
+        read: Callable[[], ParsedDocument] = partial(
+            cls._read_file, path, encoding, yaml_loader, mmap_threshold,
+            key_trie
+        )
+        cache_dir = resolve_cache_dir(path, compiled_cache)
+        if cache_dir is not None:
+            fingerprint = (
+                f"{describe_parser(cls)}:{yaml.__version__}:"
+                f"{describe_parser(yaml_loader)}:{encoding}:{selected_paths}"
+            )
+            read = partial(
+                read_compiled, path,
+                partial(
+                    cls._parse_buffer, encoding=encoding,
+                    yaml_loader=yaml_loader, only_keys=key_trie
+                ),
+                fingerprint, cache_dir, mmap_threshold
+            )
+
+        if cached:
+            read = partial(
+                read_cached, path, read,
+                (cls, encoding, yaml_loader, selected_paths)
+            )
+
+        # Empty files give None
+        data = LazyMapping(read) if lazy else (read() or {})
+
+        loader = cls(
             data=data, defaults=defaults or {},
             path=path, encoding=encoding,
             yaml_loader=yaml_loader,
-            yaml_dumper=yaml_dumper
+            yaml_dumper=yaml_dumper,
+            is_partial=selected_paths is not None,
+            preserve_format=preserve_format
         )
+        if flat_index:
+            loader.enable_flat_index()
+
+        return loader
+
+    @classmethod
+    def _read_file(
+        cls, path: Union[PathLike, Path], encoding: str, yaml_loader: Callable,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD,
+        only_keys: Optional[KeyTrie] = None
+    ) -> MutableMapping[str, Any]:
+        """
+        Reads and parses yaml file.
+
+        :param path: where is yaml file to load data from.
+        :param encoding: which encoding does config file has.
+        :param yaml_loader: function that is used for loading data from file.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :param only_keys: keys that must be parsed or None to parse all.
+        :return: parsed data.
+        """
+        with open_buffer(path, mmap_threshold) as buffer:
+            return cls._parse_buffer(buffer, encoding, yaml_loader, only_keys)
+
+    @classmethod
+    def _parse_buffer(
+        cls, buffer: Any, encoding: str, yaml_loader: Callable,
+        only_keys: Optional[KeyTrie] = None
+    ) -> MutableMapping[str, Any]:
+        """
+        Parses content of yaml file.
+
+        :param buffer: bytes or memory map with content of file.
+        :param encoding: which encoding does config file has.
+        :param yaml_loader: function that is used for loading data from file.
+        :param only_keys: keys that must be parsed or None to parse all.
+        :return: parsed data.
+        """
+        if not isinstance(buffer, bytes):
+            # Memory map is file-like itself
+            buffer.seek(0)
+
+        if not is_utf8(encoding):
+            # yaml reads stream by chunks, so they're decoded one by one
+            stream = buffer if not isinstance(buffer, bytes) else io.BytesIO(buffer)
+            return cls._parse(
+                codecs.getreader(encoding)(stream), yaml_loader, only_keys
+            )
+
+        # yaml reads utf-8 bytes and file-like memory map by itself
+        return cls._parse(buffer, yaml_loader, only_keys)
+
+    @staticmethod
+    def _parse(
+        stream: Any, yaml_loader: Callable, only_keys: Optional[KeyTrie]
+    ) -> MutableMapping[str, Any]:
+        """
+        Parses yaml from stream.
+
+        :param stream: bytes or file-like object.
+        :param yaml_loader: function that is used for loading data from file.
+        :param only_keys: keys that must be parsed or None to parse all.
+        :return: parsed data.
+        """
+        if only_keys is None:
+            return yaml_loader(stream)
+
+        # Only yaml.load with known loader class can skip constructing
+        # values that aren't needed
+        loader_cls: Optional[type] = Yaml._loader_class(yaml_loader)
+        if loader_cls is not None:
+            return select_yaml(stream, only_keys, loader_cls)
+
+        return prune(yaml_loader(stream), only_keys)
+
+    @staticmethod
+    def _loader_class(yaml_loader: Callable) -> Optional[type]:
+        """
+        Gives yaml loader class used by loading function.
+
+        :param yaml_loader: function that is used for loading data from file.
+        :return: class or None if function isn't yaml.load with Loader.
+        """
+        if getattr(yaml_loader, "func", None) is not yaml.load:
+            return None
+
+        return getattr(yaml_loader, "keywords", {}).get("Loader")
 
     def dump(self, include_defaults: bool = False) -> None:
-        to_dump = self.data
-        if include_defaults:
-            to_dump = dict(self.lookup_data)
+        if self.is_partial:
+            raise RuntimeError(
+                "Loader has only selected keys of file loaded "
+                "and can't be dumped."
+            )
+
+        to_dump = self._dump_data(include_defaults)
+        if (
+            self.preserve_format and not include_defaults
+            and self._dump_changes(to_dump)
+        ):
+            return
+
+        stream = io.StringIO()
+        self.yaml_dumper(data=to_dump, stream=stream)
+        write_text_if_changed(self.path, stream.getvalue(), self.encoding)
+
+    def _dump_changes(self, to_dump: MutableMapping[str, Any]) -> bool:
+        """
+        Rewrites only text of values changed since last dump.
+
+        :param to_dump: data that must be in file.
+        :return: False if whole file must be written instead.
+        """
+        modified_paths = self._modified_paths
+        if modified_paths is None:
+            return False
+
+        try:
+            with open(self.path, encoding=self.encoding) as yaml_f:
+                text = yaml_f.read()
+
+        except OSError:
+            return False
+
+        patched = patch_yaml(
+            text, collect_changes(to_dump, modified_paths),
+            self._loader_class(self.yaml_loader) or yaml.SafeLoader
+        )
+        if patched is None:
+            return False
+
+        try:
+            # Anything changed not through loader must be written as well
+            if self.yaml_loader(patched) != to_dump:
+                return False
+
+        except yaml.YAMLError:
+            return False
+
+        if patched != text:
+            write_text_if_changed(self.path, patched, self.encoding)
 
-        with open(self.path, 'w', encoding=self.encoding) as yaml_f:
-            self.yaml_dumper(data=to_dump, stream=yaml_f)
+        return True
@@ -0,0 +1,233 @@
+import copy
+import io
+from contextlib import ExitStack
+from functools import partial
+from os import PathLike
+from pathlib import Path
+from typing import (
+    Union, Optional, MutableMapping, Any, Callable, Iterator, List, Tuple
+)
+
+import yaml
+
+from config_framework.loaders.composite import Composite
+from config_framework.loaders.dict import Dict
+from config_framework.loaders.file_io import (
+    DEFAULT_MMAP_THRESHOLD, open_buffer, is_utf8, write_text_if_changed
+)
+from config_framework.loaders.yaml import Loader, Dumper
+from config_framework.types.abstract import AbstractLoader
+from config_framework.types.merged_view import MergedView
+
+
+class YamlStream(Composite):
+    """
+    Loader of yaml file with many documents separated by ---, where
+    every next document overrides values of previous ones.
+    Documents can also be read one by one with iter_documents.
+    """
+    path: Union[PathLike, Path]
+    encoding: str
+    yaml_dumper: Callable
+
+    def __init__(
+        self, data: MutableMapping[str, Any],
+        defaults: MutableMapping[str, Any],
+        loaders: Tuple[AbstractLoader, ...],
+        deep_merge: bool,
+        path: Union[PathLike, Path],
+        encoding: str,
+        yaml_dumper: Callable
+    ):
+        super().__init__(data, defaults, loaders, deep_merge)
+        self.path = path
+        self.encoding = encoding
+        setattr(self, "yaml_dumper", yaml_dumper)
+
+    @classmethod
+    def load(  # type: ignore
+        cls, path: Union[PathLike, Path],
+        defaults: Optional[MutableMapping[str, Any]] = None,
+        encoding: str = "utf8",
+        yaml_loader=partial(yaml.load_all, Loader=Loader),
+        yaml_dumper=partial(yaml.dump_all, Dumper=Dumper),
+        deep_merge: bool = True,
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+    ):
+        """
+        Loads all documents of yaml file as layers of config.
+
+        :param path: where is yaml file to load data from.
+        :param defaults: default values for config.
+        :param encoding: which encoding does config file has (defaults to utf-8).
+        :param yaml_loader: function that gives iterator of documents.
+        :param yaml_dumper: function that saves many documents to file.
+        :param deep_merge: merge nested sections of documents instead
+            of taking whole top level section from the last document
+            that has it.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :return: instance of yaml stream loader.
+        """
+        documents = list(
+            cls.iter_documents(path, encoding, yaml_loader, mmap_threshold)
+        )
+        # Composite gives priority to the first loader
+        loaders = tuple(reversed(documents))
+
+        return cls(
+            data={} if deep_merge else MergedView(*loaders),
+            defaults=defaults or {},
+            loaders=loaders,
+            deep_merge=deep_merge,
+            path=path, encoding=encoding,
+            yaml_dumper=yaml_dumper
+        )
+
+    @staticmethod
+    def iter_documents(
+        path: Union[PathLike, Path],
+        encoding: str = "utf8",
+        yaml_loader=partial(yaml.load_all, Loader=Loader),
+        mmap_threshold: Optional[int] = DEFAULT_MMAP_THRESHOLD
+    ) -> Iterator[Dict]:
+        """
+        Gives documents of yaml file one by one, parsing each only when
+        it's requested, so only one document is kept in memory at once.
+
+        :param path: where is yaml file to load data from.
+        :param encoding: which encoding does config file has (defaults to utf-8).
+        :param yaml_loader: function that gives iterator of documents.
+        :param mmap_threshold: file size in bytes starting from which file
+            is memory mapped instead of being read, None disables it.
+        :return: iterator of dict loaders with documents.
+        """
+        if not is_utf8(encoding):
+            with open(path, encoding=encoding) as data_f:
+                for document in yaml_loader(data_f):
+                    yield Dict.load(document or {})
+
+            return
+
+        with open_buffer(path, mmap_threshold) as buffer:
+            for document in yaml_loader(buffer):
+                yield Dict.load(document or {})
+
+    @property
+    def documents(self) -> Tuple[AbstractLoader, ...]:
+        """
+        Gives loaders of documents in order they are in file.
+        """
+        return tuple(reversed(self.loaders))
+
+    @classmethod
+    async def aload(cls, *args: Any, **kwargs: Any):  # type: ignore
+        """
+        Runs load method in executor, so reading and parsing
+        don't block event loop.
+
+        :param args: positional arguments of load method.
+        :param kwargs: keyword arguments of load method.
+        :return: instance of yaml stream loader.
+        """
+        # Documents are read from one file, not from loaders
+        # given like in composite, so base version is used
+        return await AbstractLoader.aload.__func__(  # type: ignore
+            cls, *args, **kwargs
+        )
+
+    async def adump(self, include_defaults: bool = False) -> None:
+        """
+        Runs dump method in executor, so all documents
+        are written to file at once without blocking event loop.
+
+        :param include_defaults: specifies if defaults must be
+            written to the first document.
+        :return: nothing.
+        """
+        await AbstractLoader.adump(self, include_defaults)
+
+    def _save_now(
+        self, include_defaults: bool = False, force: bool = False,
+        in_background: bool = False
+    ) -> bool:
+        """
+        Writes documents back to file only if any of them was changed.
+
+        :param include_defaults: specifies if defaults must be
+            written to the first document.
+        :param force: dump documents even if they weren't changed.
+        :param in_background: write copy of documents, so they can be
+            changed from other threads while file is written.
+        :return: True if file was dumped.
+        """
+        if not (
+            force or self.is_dirty or (include_defaults and self.defaults)
+        ):
+            return False
+
+        documents = self.documents
+        with ExitStack() as locks:
+            for document in documents:
+                locks.enter_context(document._data_lock)
+
+            if not in_background:
+                self.dump(include_defaults)
+                for document in documents:
+                    document._clear_modified()
+
+                return True
+
+            to_dump = [
+                copy.deepcopy(document._dump_data(False))
+                for document in documents
+            ]
+            modified_paths = [
+                document._take_modified() for document in documents
+            ]
+
+        try:
+            self._write_documents(to_dump, include_defaults)
+
+        except BaseException:
+            for document, paths in zip(documents, modified_paths):
+                document._restore_modified(paths)
+
+            raise
+
+        return True
+
+    def dump(self, include_defaults: bool = False) -> None:
+        """
+        Writes all documents back to file.
+
+        :param include_defaults: specifies if defaults must be
+            written to the first document.
+        :return: nothing.
+        """
+        self._write_documents(
+            [document._dump_data(False) for document in self.documents],
+            include_defaults
+        )
+
+    def _write_documents(
+        self, to_dump: List[MutableMapping[str, Any]],
+        include_defaults: bool
+    ) -> None:
+        """
+        Writes given documents to file.
+
+        :param to_dump: data of documents in order they must be in file.
+        :param include_defaults: specifies if defaults must be
+            written to the first document.
+        :return: nothing.
+        """
+        if include_defaults:
+            if not to_dump:
+                to_dump.append({})
+
+            to_dump[0] = {**self.defaults, **to_dump[0]}
+
+        stream = io.StringIO()
+        self.yaml_dumper(to_dump, stream=stream)
+        write_text_if_changed(self.path, stream.getvalue(), self.encoding)
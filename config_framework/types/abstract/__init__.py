@@ -1 +1 @@
-from .loader import AbstractLoader
+from .loader import AbstractLoader, MISSING
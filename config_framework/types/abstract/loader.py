@@ -1,11 +1,44 @@
 from __future__ import annotations
 
 import abc
-from collections import ChainMap
+import asyncio
+import copy
+import threading
+import weakref
+from functools import partial
 from time import time
-from typing import MutableMapping, Any, Union, Optional
+from typing import (
+    MutableMapping, Mapping, Any, Optional, List, Dict, Iterable, Tuple, Set
+)
 
-from ..variable_key import VariableKey
+from ..dump_scheduler import DumpScheduler, default_dump_scheduler
+from ..lazy_mapping import LazyMapping
+from ..lookup_cache import (
+    LookupCache, FlatPathIndex, LookupCacheStats, NOT_CACHED
+)
+from ..merged_view import MergedView
+from ..variable_key import KeyLike, KeyPath, compile_key, format_path
+
+
+class _Missing:
+    """
+    Marks values that weren't found by loader.
+    """
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+# Marks the end of a path inside prefix trie built by get_many
+_PATH_END = None
 
 
 class AbstractLoader(MutableMapping, abc.ABC):
@@ -15,9 +48,17 @@ class AbstractLoader(MutableMapping, abc.ABC):
     data: MutableMapping[str, Any]
     defaults: MutableMapping[str, Any]
 
-    lookup_data: MutableMapping[str, Any]
+    lookup_data: MergedView
     __created_at: str
 
+    _lookup_cache: Optional[LookupCache] = None
+    _dump_scheduler: Optional[DumpScheduler] = None
+    _dependents: List[weakref.ReferenceType]
+    # Paths changed since last dump, None if anything could be changed
+    _modified_paths: Optional[Set[KeyPath]]
+    # Guards data and changed paths while loader is saved
+    _data_lock: threading.RLock
+
     def __init__(
         self, data: MutableMapping[str, Any],
         defaults: MutableMapping[str, Any]
@@ -30,10 +71,13 @@ class AbstractLoader(MutableMapping, abc.ABC):
         self.defaults = defaults
 
         self.__created_at: str = str(time())
-        self.lookup_data: ChainMap = ChainMap(self.data, self.defaults)
+        self.lookup_data = MergedView(self.data, self.defaults)
+        self._dependents = []
+        self._modified_paths = set()
+        self._data_lock = threading.RLock()
 
     def get(
-        self, key: Union[VariableKey, str],
+        self, key: KeyLike,
         default: Optional[Any] = None
     ) -> Any:
         """
@@ -48,7 +92,69 @@ class AbstractLoader(MutableMapping, abc.ABC):
         except KeyError:
             return default
 
-    def __getitem__(self, key: Union[VariableKey, str]) -> Any:
+    def get_many(self, keys: Iterable[KeyLike]) -> List[Any]:
+        """
+        Gives values under many keys at once. Keys are grouped by their
+        common parts, so every shared part of path is walked only once.
+
+        :param keys: keys that are used to find items.
+        :return: values in the same order as keys, with MISSING in place
+            of values that weren't found.
+        """
+        paths: List[KeyPath] = [compile_key(key) for key in keys]
+        values: List[Any] = [MISSING] * len(paths)
+
+        lookup_cache = self._lookup_cache
+        trie: Dict[Optional[str], Any] = {}
+        for index, path in enumerate(paths):
+            if lookup_cache is not None:
+                cached_value = lookup_cache.get(path)
+                if cached_value is not NOT_CACHED:
+                    values[index] = cached_value
+                    continue
+
+                if lookup_cache.is_complete:
+                    continue
+
+            node = trie
+            for piece in path:
+                node = node.setdefault(piece, {})
+
+            node.setdefault(_PATH_END, []).append(index)
+
+        stack: List[Tuple[Any, Dict[Optional[str], Any]]] = [
+            (self.lookup_data, trie)
+        ]
+        while stack:
+            container, node = stack.pop()
+            if not isinstance(container, Mapping):
+                continue
+
+            for sub_key, child_node in node.items():
+                if sub_key is _PATH_END:
+                    continue
+
+                value = container.get(sub_key, MISSING)
+                if value is MISSING:
+                    continue
+
+                indexes: Optional[List[int]] = child_node.get(_PATH_END)
+                if indexes is not None:
+                    for index in indexes:
+                        values[index] = value
+
+                    if lookup_cache is not None:
+                        lookup_cache.store(paths[indexes[0]], value)
+
+                    if len(child_node) > 1:
+                        stack.append((value, child_node))
+
+                else:
+                    stack.append((value, child_node))
+
+        return values
+
+    def __getitem__(self, key: KeyLike) -> Any:
         """
         Returns an item under specified key.
 
@@ -59,22 +165,35 @@ class AbstractLoader(MutableMapping, abc.ABC):
             raises KeyValue with details
             about which key was used and what part of it wasn't found.
         """
-        if isinstance(key, str):
-            key = VariableKey(key)
+        path = compile_key(key)
+
+        lookup_cache = self._lookup_cache
+        if lookup_cache is not None:
+            cached_value = lookup_cache.get(path)
+            if cached_value is not NOT_CACHED:
+                return cached_value
+
+            if lookup_cache.is_complete:
+                raise KeyError(
+                    f"Couldn't find any value using key: {format_path(path)}"
+                )
 
         variable: Any = self.lookup_data
-        for sub_key in key:
+        for sub_key in path:
             try:
                 variable = variable[sub_key]
 
             except KeyError as key_error:
                 raise KeyError(
-                    f"Couldn't find any value using key: {key}"
+                    f"Couldn't find any value using key: {format_path(path)}"
                 ) from key_error
 
+        if lookup_cache is not None:
+            lookup_cache.store(path, variable)
+
         return variable
 
-    def __setitem__(self, key: Union[VariableKey, str], value: Any) -> None:
+    def __setitem__(self, key: KeyLike, value: Any) -> None:
         """
         Sets an item value under specified key.
         :param key: key that is used to find an item.
@@ -83,26 +202,27 @@ class AbstractLoader(MutableMapping, abc.ABC):
             raises KeyError with details
             about which key was used and what part of it wasn't found.
         """
-        if isinstance(key, str):
-            key = VariableKey(key)
+        path = compile_key(key)
 
         variable: MutableMapping[str, Any] = self.lookup_data
-        key_as_tuple = tuple(key)
-        for sub_key in key_as_tuple[:-1]:
+        for sub_key in path[:-1]:
             try:
                 variable = variable[sub_key]
 
             except KeyError as key_error:
                 raise KeyError(
-                    f"Couldn't find any value using key: {key}"
+                    f"Couldn't find any value using key: {format_path(path)}"
                 ) from key_error
 
-        variable_key = key_as_tuple[-1]
+        variable_key = path[-1]
         if variable_key not in variable:
             raise KeyError(
-                f"There's no such key in loader: {key}"
+                f"There's no such key in loader: {format_path(path)}"
             )
-        variable[variable_key] = value
+
+        with self._data_lock:
+            variable[variable_key] = value
+            self._notify_changed(path)
 
     @abc.abstractmethod
     def dump(self, include_defaults: bool = False) -> None:
@@ -115,6 +235,164 @@ class AbstractLoader(MutableMapping, abc.ABC):
         """
         pass
 
+    @classmethod
+    async def aload(cls, *args: Any, **kwargs: Any) -> AbstractLoader:
+        """
+        Runs load method of loader in executor, so reading and parsing
+        don't block event loop.
+
+        :param args: positional arguments of load method.
+        :param kwargs: keyword arguments of load method.
+        :return: instance of loader.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(cls.load, *args, **kwargs)  # type: ignore
+        )
+
+    async def adump(self, include_defaults: bool = False) -> None:
+        """
+        Runs dump method in executor, so serializing and writing
+        don't block event loop.
+
+        :param include_defaults: specifies if
+            you want to have default variables to be dumped.
+        :return: nothing.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.dump, include_defaults)
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Tells if loader was changed since it was loaded or dumped last time.
+        Changes made directly to containers returned by loader
+        aren't noticed.
+        """
+        return self._modified_paths is None or bool(self._modified_paths)
+
+    def save(
+        self, include_defaults: bool = False, force: bool = False
+    ) -> bool:
+        """
+        Dumps loader only if something was changed, so clean loaders
+        don't serialize or write anything. With write behind enabled
+        loader is saved later in background instead.
+
+        :param include_defaults: specifies if
+            you want to have default variables to be dumped.
+        :param force: dump loader even if it wasn't changed through it,
+            so changes made directly to containers returned
+            by it are saved too.
+        :return: True if loader was dumped or scheduled to be dumped.
+        """
+        if self._dump_scheduler is not None:
+            self._dump_scheduler.schedule(self, include_defaults, force)
+            return True
+
+        return self._save_now(include_defaults, force)
+
+    def _save_now(
+        self, include_defaults: bool, force: bool = False,
+        in_background: bool = False
+    ) -> bool:
+        """
+        Dumps loader right now if something was changed.
+
+        :param include_defaults: specifies if
+            you want to have default variables to be dumped.
+        :param force: dump loader even if it wasn't changed through it.
+        :param in_background: dump copy of loader, so it can be changed
+            from other threads while being written.
+        :return: True if loader was dumped.
+        """
+        with self._data_lock:
+            # Defaults might not be in storage yet, so they must be checked
+            if not (
+                force or self.is_dirty or (include_defaults and self.defaults)
+            ):
+                return False
+
+            if not in_background:
+                # Changes from other threads wait until loader is dumped
+                self.dump(include_defaults)
+                self._clear_modified()
+                return True
+
+            # Copy knows what was changed, while changes made from now on
+            # are saved next time
+            snapshot = copy.deepcopy(self)
+            modified_paths = self._take_modified()
+
+        try:
+            snapshot.dump(include_defaults)
+
+        except BaseException:
+            self._restore_modified(modified_paths)
+            raise
+
+        return True
+
+    def enable_write_behind(
+        self, scheduler: Optional[DumpScheduler] = None
+    ) -> None:
+        """
+        Makes save calls write loader in background, merging many saves
+        made in short time into one write.
+
+        :param scheduler: scheduler that saves loader, shared
+            default one is used if not specified.
+        :return: nothing.
+        """
+        self._dump_scheduler = scheduler or default_dump_scheduler
+
+    def disable_write_behind(self) -> None:
+        """
+        Saves loader if it's waiting for that and makes save calls
+        write loader right away again.
+
+        :return: nothing.
+        """
+        self.flush()
+        self._dump_scheduler = None
+
+    def flush(self) -> None:
+        """
+        Saves loader right now if it's waiting to be saved in background.
+
+        :return: nothing.
+        :raises config_framework.types.custom_exceptions.SavingError:
+            if any of background saves failed.
+        """
+        if self._dump_scheduler is not None:
+            self._dump_scheduler.flush(self)
+
+    def prefetch(self) -> None:
+        """
+        Starts parsing data in background, if loader defers parsing
+        until first access.
+
+        :return: nothing.
+        """
+        if isinstance(self.data, LazyMapping):
+            self.data.prefetch()
+
+    def _dump_data(self, include_defaults: bool) -> MutableMapping[str, Any]:
+        """
+        Gives plain data that must be dumped.
+
+        :param include_defaults: specifies if
+            you want to have default variables to be dumped.
+        :return: mapping with data.
+        """
+        if include_defaults:
+            return dict(self.lookup_data)
+
+        if isinstance(self.data, LazyMapping):
+            return self.data.materialize()
+
+        return self.data
+
     def dump_to(
         self, other_loader: AbstractLoader,
         include_defaults: bool = False
@@ -133,13 +411,9 @@ class AbstractLoader(MutableMapping, abc.ABC):
             an instance of AbstractLoader subclass.
         """
         if isinstance(other_loader, AbstractLoader):
-            if include_defaults:
-                other_loader.defaults = self.defaults
-
-            other_loader.data = self.data
-            other_loader.lookup_data = ChainMap(
-                other_loader.data,
-                other_loader.defaults
+            other_loader._replace_data(
+                self.data,
+                self.defaults if include_defaults else other_loader.defaults
             )
             other_loader.dump(include_defaults)
 
@@ -149,32 +423,208 @@ class AbstractLoader(MutableMapping, abc.ABC):
                 f"to dump variables to. Got type: {type(other_loader)}"
             )
 
+    def _replace_data(
+        self, data: MutableMapping[str, Any],
+        defaults: MutableMapping[str, Any]
+    ) -> None:
+        """
+        Swaps loaded data with new one, for example when it's reloaded.
+
+        :param data: new data.
+        :param defaults: new default values.
+        :return: nothing.
+        """
+        with self._data_lock:
+            self.data = data
+            self.defaults = defaults
+            self.lookup_data = MergedView(self.data, self.defaults)
+            self._notify_changed(None)
+
+    def enable_lookup_cache(self) -> None:
+        """
+        Turns on memoization of values found by keys. Cache is dropped on
+        any change made through this loader, but changes made directly
+        to containers returned by it won't be noticed.
+
+        :return: nothing.
+        """
+        if self._lookup_cache is None:
+            self._lookup_cache = LookupCache()
+
+    def enable_flat_index(self) -> None:
+        """
+        Indexes every value of loader by its full path at once, so any
+        lookup doesn't need to walk nested mappings. Index is kept in sync
+        with changes made through this loader.
+
+        :return: nothing.
+        """
+        if not isinstance(self._lookup_cache, FlatPathIndex):
+            self._lookup_cache = FlatPathIndex(
+                self.lookup_data,
+                deferred=(
+                    isinstance(self.data, LazyMapping)
+                    and not self.data.loaded
+                )
+            )
+
+    def disable_lookup_cache(self) -> None:
+        """
+        Turns off memoization of values found by keys and flat index.
+
+        :return: nothing.
+        """
+        self._lookup_cache = None
+
+    @property
+    def lookup_cache_stats(self) -> Optional[LookupCacheStats]:
+        """
+        Gives hits, misses and size of lookup cache
+        or None if it's disabled.
+        """
+        if self._lookup_cache is None:
+            return None
+
+        return self._lookup_cache.stats
+
+    def _notify_changed(self, path: Optional[KeyPath]) -> None:
+        """
+        Invalidates everything that depends on value under path.
+
+        :param path: path of changed value or None if everything changed.
+        :return: nothing.
+        """
+        if self._lookup_cache is not None:
+            self._lookup_cache.invalidate(path, self.lookup_data)
+
+        if path is None:
+            self._modified_paths = None
+
+        elif self._modified_paths is not None:
+            self._modified_paths.add(path)
+
+        alive_dependents = []
+        for dependent_ref in self._dependents:
+            dependent: Optional[AbstractLoader] = dependent_ref()
+            if dependent is None:
+                continue
+
+            alive_dependents.append(dependent_ref)
+            dependent._on_source_changed(self, path)
+
+        self._dependents = alive_dependents
+
+    def _clear_modified(self) -> None:
+        """
+        Forgets about changes, after they were saved.
+
+        :return: nothing.
+        """
+        self._modified_paths = set()
+
+    def _take_modified(self) -> Optional[Set[KeyPath]]:
+        """
+        Forgets about changes that are going to be saved.
+
+        :return: paths changed since last dump,
+            None if anything could be changed.
+        """
+        with self._data_lock:
+            modified_paths = self._modified_paths
+            self._modified_paths = set()
+
+        return modified_paths
+
+    def _restore_modified(
+        self, modified_paths: Optional[Set[KeyPath]]
+    ) -> None:
+        """
+        Brings back changes that weren't saved because of error.
+
+        :param modified_paths: paths given by _take_modified.
+        :return: nothing.
+        """
+        with self._data_lock:
+            if modified_paths is None or self._modified_paths is None:
+                self._modified_paths = None
+
+            else:
+                self._modified_paths |= modified_paths
+
+    def _add_dependent(self, loader: AbstractLoader) -> None:
+        """
+        Registers loader that must be notified about changes of this one.
+
+        :param loader: loader that uses this one as a source.
+        :return: nothing.
+        """
+        if all(ref() is not loader for ref in self._dependents):
+            self._dependents.append(weakref.ref(loader))
+
+    def _on_source_changed(
+        self, source: AbstractLoader, path: Optional[KeyPath]
+    ) -> None:
+        """
+        Called when loader this one depends on got modified.
+
+        :param source: modified loader.
+        :param path: path of changed value or None if everything changed.
+        :return: nothing.
+        """
+        self._notify_changed(path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Other loaders aren't copied together with this one
+        state["_dependents"] = []
+        # Background thread of scheduler can't be copied
+        state.pop("_dump_scheduler", None)
+        # Locks can't be copied, new loader gets its own
+        state.pop("_data_lock", None)
+        lookup_cache: Optional[LookupCache] = state.get("_lookup_cache")
+        if lookup_cache is not None:
+            state["_lookup_cache"] = type(lookup_cache)()
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._data_lock = threading.RLock()
+        if self._lookup_cache is not None:
+            self._lookup_cache.invalidate(None, self.lookup_data)
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
-    def __delitem__(self, key: Union[str, VariableKey]) -> None:
+    def __delitem__(self, key: KeyLike) -> None:
         """
         Deletes value from loader by VariableKey.
 
         :param key: the key that must be deleted from loader.
         :return: nothing.
         """
-        if isinstance(key, str):
-            key = VariableKey(key)
+        path = compile_key(key)
 
         variable: Any = self.lookup_data
-        key_as_tuple = tuple(key)
-        for sub_key in key_as_tuple[:-1]:
+        for sub_key in path[:-1]:
             try:
                 variable = variable[sub_key]
 
             except KeyError as key_error:
                 raise KeyError(
-                    f"Couldn't find any value using key: {key}"
+                    f"Couldn't find any value using key: {format_path(path)}"
                 ) from key_error
 
-        variable_key = key_as_tuple[-1]
-        del variable[variable_key]
+        variable_key = path[-1]
+        with self._data_lock:
+            del variable[variable_key]
+            self._notify_changed(path)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            return key in self.lookup_data
+
+        return super().__contains__(key)
 
     def __len__(self) -> int:
         return len(self.lookup_data)
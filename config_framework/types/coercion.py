@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import enum
+import json
+import re
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union
+
+from .custom_exceptions import InvalidValueError
+
+if TYPE_CHECKING:
+    from .variable import CustomDeserializer, Variable  # noqa: Used for mypy
+
+Coercer = Callable[[Any], Any]
+
+TRUE_STRINGS = frozenset(("1", "true", "yes", "y", "on"))
+FALSE_STRINGS = frozenset(("0", "false", "no", "n", "off", ""))
+
+_DURATION_PART = re.compile(
+    r"\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|[smhdw])", re.IGNORECASE
+)
+_DURATION_UNITS = {
+    "ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800
+}
+
+
+def _type_name(annotation: Any) -> str:
+    return getattr(annotation, "__name__", None) or repr(annotation)
+
+
+def _fail(value: Any, annotation: Any) -> InvalidValueError:
+    return InvalidValueError(
+        f"Can't convert {value!r} to {_type_name(annotation)}"
+    )
+
+
+def _coerce_int(value: Any) -> int:
+    if type(value) is int:
+        return value
+
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+
+        except ValueError:
+            raise _fail(value, int) from None
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(value)
+
+    raise _fail(value, int)
+
+
+def _coerce_float(value: Any) -> float:
+    if type(value) is float:
+        return value
+
+    if isinstance(value, (int, str)) and not isinstance(value, bool):
+        try:
+            return float(value)
+
+        except ValueError:
+            raise _fail(value, float) from None
+
+    raise _fail(value, float)
+
+
+def _coerce_bool(value: Any) -> bool:
+    if type(value) is bool:
+        return value
+
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_STRINGS:
+            return True
+
+        if lowered in FALSE_STRINGS:
+            return False
+
+    elif isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+
+    raise _fail(value, bool)
+
+
+def _coerce_str(value: Any) -> str:
+    if type(value) is str:
+        return value
+
+    if isinstance(value, (int, float, str, PurePath)):
+        return str(value)
+
+    raise _fail(value, str)
+
+
+def _coerce_timedelta(value: Any) -> timedelta:
+    """
+    Accepts number of seconds, HH:MM:SS and strings like 1h30m or 500ms.
+    """
+    if isinstance(value, timedelta):
+        return value
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return timedelta(seconds=value)
+
+    if not isinstance(value, str):
+        raise _fail(value, timedelta)
+
+    text = value.strip()
+    try:
+        return timedelta(seconds=float(text))
+
+    except ValueError:
+        pass
+
+    if ":" in text:
+        try:
+            seconds = 0.0
+            for part in text.split(":"):
+                seconds = seconds * 60 + float(part)
+
+            return timedelta(seconds=seconds)
+
+        except ValueError:
+            raise _fail(value, timedelta) from None
+
+    seconds = 0.0
+    position = 0
+    for match in _DURATION_PART.finditer(text):
+        if match.start() != position:
+            break
+
+        number, unit = match.groups()
+        seconds += float(number) * _DURATION_UNITS[unit.lower()]
+        position = match.end()
+
+    if position == 0 or position != len(text):
+        raise _fail(value, timedelta)
+
+    return timedelta(seconds=seconds)
+
+
+def _split_items(value: Any) -> Any:
+    # Environment variables give lists as json or comma separated text
+    if not isinstance(value, str):
+        return value
+
+    text = value.strip()
+    if text.startswith(("[", "{")):
+        try:
+            return json.loads(text)
+
+        except ValueError:
+            raise _fail(value, list) from None
+
+    if not text:
+        return []
+
+    return [item.strip() for item in text.split(",")]
+
+
+_SIMPLE_COERCERS = {
+    int: _coerce_int,
+    float: _coerce_float,
+    bool: _coerce_bool,
+    str: _coerce_str,
+    timedelta: _coerce_timedelta,
+}
+
+
+@lru_cache(maxsize=None)
+def compile_coercer(annotation: Any) -> Optional[Coercer]:
+    """
+    Builds function that converts raw loader value to annotated type.
+    Functions are built once for every annotation.
+
+    Supported are int, float, bool, str, timedelta, Path, enums,
+    Optional and Union of them, lists, tuples, sets and dicts.
+
+    :param annotation: type from Variable annotation, like int or List[int].
+    :return: function converting value or None if annotation
+        doesn't need conversion (like Any) or isn't supported.
+    :raises config_framework.types.custom_exceptions.InvalidValueError:
+        from built function, if value can't be converted.
+    """
+    simple = _SIMPLE_COERCERS.get(annotation)
+    if simple is not None:
+        return simple
+
+    origin = getattr(annotation, "__origin__", None)
+    args: Tuple[Any, ...] = getattr(annotation, "__args__", None) or ()
+
+    if origin is Union:
+        return _compile_union(args)
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return _compile_enum(annotation)
+
+        if issubclass(annotation, PurePath):
+            return _compile_path(annotation)
+
+        if annotation in (list, tuple, set, frozenset, dict):
+            origin, args = annotation, ()
+
+    if origin in (list, set, frozenset):
+        return _compile_collection(origin, args[0] if args else Any)
+
+    if origin is tuple:
+        return _compile_tuple(args)
+
+    if origin is dict:
+        return _compile_dict(*(args or (Any, Any)))
+
+    return None
+
+
+def _compile_union(args: Tuple[Any, ...]) -> Coercer:
+    allows_none = type(None) in args
+    options = [
+        (arg, compile_coercer(arg)) for arg in args if arg is not type(None)
+    ]
+
+    def coerce_union(value: Any) -> Any:
+        if value is None and allows_none:
+            return None
+
+        # Value that already has one of types is kept as is
+        for option, _ in options:
+            if isinstance(option, type) and type(value) is option:
+                return value
+
+        for option, coercer in options:
+            if coercer is None:
+                return value
+
+            try:
+                return coercer(value)
+
+            except InvalidValueError:
+                continue
+
+        raise _fail(value, Union[args])  # type: ignore
+
+    return coerce_union
+
+
+def _compile_enum(enum_type: Any) -> Coercer:
+    def coerce_enum(value: Any) -> Any:
+        if isinstance(value, enum_type):
+            return value
+
+        try:
+            return enum_type(value)
+
+        except ValueError:
+            pass
+
+        if isinstance(value, str) and value in enum_type.__members__:
+            return enum_type.__members__[value]
+
+        raise _fail(value, enum_type)
+
+    return coerce_enum
+
+
+def _compile_path(path_type: Any) -> Coercer:
+    def coerce_path(value: Any) -> Any:
+        if type(value) is path_type:
+            return value
+
+        if isinstance(value, (str, PurePath)):
+            return path_type(value)
+
+        raise _fail(value, path_type)
+
+    return coerce_path
+
+
+def _compile_collection(collection_type: type, item_type: Any) -> Coercer:
+    item_coercer = compile_coercer(item_type)
+
+    def coerce_collection(value: Any) -> Any:
+        items = _split_items(value)
+        if not isinstance(items, (list, tuple, set, frozenset)):
+            raise _fail(value, collection_type)
+
+        if item_coercer is None:
+            return collection_type(items)
+
+        return collection_type(item_coercer(item) for item in items)
+
+    return coerce_collection
+
+
+def _compile_tuple(args: Tuple[Any, ...]) -> Coercer:
+    if not args or (len(args) == 2 and args[1] is Ellipsis):
+        return _compile_collection(tuple, args[0] if args else Any)
+
+    item_coercers = [compile_coercer(arg) for arg in args]
+
+    def coerce_tuple(value: Any) -> Any:
+        items = _split_items(value)
+        if (
+            not isinstance(items, (list, tuple))
+            or len(items) != len(item_coercers)
+        ):
+            raise _fail(value, tuple)
+
+        return tuple(
+            item if coercer is None else coercer(item)
+            for coercer, item in zip(item_coercers, items)
+        )
+
+    return coerce_tuple
+
+
+def _compile_dict(key_type: Any, value_type: Any) -> Coercer:
+    key_coercer = compile_coercer(key_type)
+    value_coercer = compile_coercer(value_type)
+
+    def coerce_dict(value: Any) -> Any:
+        items = _split_items(value)
+        if not isinstance(items, dict):
+            raise _fail(value, dict)
+
+        if key_coercer is None and value_coercer is None:
+            return dict(items)
+
+        return {
+            (key if key_coercer is None else key_coercer(key)):
+            (item if value_coercer is None else value_coercer(item))
+            for key, item in items.items()
+        }
+
+    return coerce_dict
+
+
+def variable_type(annotation: Any) -> Any:
+    """
+    Gives type of value from annotation of variable, like int
+    from Variable[int].
+
+    :param annotation: annotation of variable.
+    :return: type or None if annotation doesn't have it.
+    """
+    args = getattr(annotation, "__args__", None)
+    if not args:
+        return None
+
+    return args[0]
+
+
+def coercing_deserializer(coercer: Coercer) -> CustomDeserializer:
+    """
+    Wraps coercer into function that can be used as custom_deserializer
+    of Variable.
+
+    :param coercer: function from compile_coercer.
+    :return: deserializer that tells key of variable if value is invalid.
+    """
+    def deserialize(variable: Variable, from_value: Any) -> Any:
+        try:
+            return coercer(from_value)
+
+        except InvalidValueError as error:
+            raise InvalidValueError(f"{variable.key}: {error}") from error
+
+    return deserialize
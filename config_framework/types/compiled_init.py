@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+from .abstract.loader import AbstractLoader, MISSING
+from .variable import Variable
+
+ValuesLoader = Callable[[AbstractLoader], List[Any]]
+
+
+def compile_values_loader(layout: Dict[Variable, int]) -> ValuesLoader:
+    """
+    Generates function loading values of all variables of config
+    without loops and calls that do nothing: keys are fetched at once,
+    default deserializers and validators are skipped and every value
+    is validated once.
+
+    Generated function must be built again if any deserializer or
+    validator of variables is registered after that.
+
+    :param layout: variables mapped to index of their value.
+    :return: function that takes loader and gives list of values
+        in order of layout.
+    """
+    variables = sorted(layout, key=layout.__getitem__)
+    namespace: Dict[str, Any] = {
+        "MISSING": MISSING,
+        "keys": tuple(variable.key for variable in variables),
+    }
+    lines: List[str] = [
+        "def load_values(loader):",
+        "    raw = loader.get_many(keys)",
+    ]
+
+    for index, variable in enumerate(variables):
+        value = f"v{index}"
+        namespace[f"var{index}"] = variable
+        if not _is_plain(variable):
+            lines.append(
+                f"    {value} = var{index}._load_value(loader, raw[{index}])"
+            )
+            continue
+
+        lines.append(f"    {value} = raw[{index}]")
+        lines.append(f"    if {value} is MISSING:")
+        if variable.default:
+            namespace[f"default{index}"] = variable.default
+            lines.append(f"        {value} = default{index}")
+
+        else:
+            namespace[f"missing{index}"] = (
+                f"Couldn't find any value using key: {variable.key}"
+            )
+            lines.append(f"        raise KeyError(missing{index})")
+
+        if not variable._has_custom_loading():
+            continue
+
+        # Custom functions get copy of variable with source of this load
+        lines.append(f"    bound{index} = var{index}._with_source(loader)")
+        deserializer = variable.custom_deserializer
+        if deserializer is not Variable.custom_deserializer:
+            namespace[f"deserialize{index}"] = deserializer
+            lines.append(
+                f"    {value} = deserialize{index}(bound{index}, {value})"
+            )
+
+        if variable.custom_validator is not Variable.custom_validator:
+            lines.append(f"    bound{index}.validate_value({value})")
+
+    lines.append(
+        "    return [" + ", ".join(
+            f"v{index}" for index in range(len(variables))
+        ) + "]"
+    )
+
+    exec(compile("\n".join(lines), "<config values loader>", "exec"), namespace)
+    return namespace["load_values"]
+
+
+def _is_plain(variable: Variable) -> bool:
+    # Variables changing how values are loaded are called as is
+    variable_type = type(variable)
+    return all(
+        getattr(variable_type, name) is getattr(Variable, name)
+        for name in ("_load_value", "deserialize", "validate_value")
+    )
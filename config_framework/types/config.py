@@ -1,15 +1,38 @@
 from __future__ import annotations
 
-from typing import Set, ClassVar
+import sys
+import typing
+from typing import Any, Dict, Set, ClassVar, List, Optional
 
-from .abstract.loader import AbstractLoader
-from .variable import Variable
+from .abstract.loader import AbstractLoader, MISSING
+from .compiled_init import ValuesLoader, compile_values_loader
+from .coercion import compile_coercer, coercing_deserializer, variable_type
+from .variable import Variable, NOT_RESOLVED
+from .variable_key import VariableKey
 
 
 class BaseConfig:
+    """
+    Values of variables are stored in list of every config instance,
+    in order given by _layout of config class, so many instances of same
+    config can exist at once. Subclasses can declare empty __slots__
+    to not have __dict__ for each instance.
+    """
+    __slots__ = ("frozen", "_loader", "_values", "__weakref__")
+
     frozen: bool
     _loader: AbstractLoader
+    _values: List[Any]
     _variables: ClassVar[Set[Variable]]
+    # Variables mapped to index of their values in _values
+    _layout: ClassVar[Dict[Variable, int]] = {}
+    # Generated function loading values and registrations count it was
+    # made at, used only if class is made with compiled_init=True
+    _compiled_init: ClassVar[bool] = False
+    _values_loader: ClassVar[Optional[ValuesLoader]] = None
+    _values_loader_version: ClassVar[int] = -1
+    # Values are loaded on first access if class is made with lazy=True
+    _lazy: ClassVar[bool] = False
 
     def __init__(self, loader: AbstractLoader, frozen: bool = True):
         """
@@ -23,13 +46,71 @@ class BaseConfig:
         """
         self.frozen = False
 
-        for variable in self._variables:
-            variable._set_value_from_loader(loader)
+        cls = type(self)
+        if cls._lazy:
+            self._values = [NOT_RESOLVED] * len(self._layout)
+
+        elif cls._compiled_init:
+            if cls._values_loader_version != Variable._registrations:
+                cls._compile_values_loader()
+
+            self._values = cls._values_loader(loader)  # type: ignore
+
+        else:
+            variables = self._layout
+            raw_values = loader.get_many(
+                variable.key for variable in variables
+            )
+            self._values = [MISSING] * len(variables)
+            for variable, raw_value in zip(variables, raw_values):
+                self._values[variables[variable]] = variable._load_value(
+                    loader, raw_value
+                )
 
+        # Lazy values are loaded from it, so it's set before __post_init__
         self._loader = loader
         self.__post_init__()
         self.frozen: bool = frozen
 
+    def _resolve(self, variable: Variable) -> Any:
+        """
+        Loads value of variable of lazy config and keeps it.
+
+        :param variable: variable of this config.
+        :return: value of variable.
+        :raises KeyError: if value wasn't found and there's no default.
+        :raises config_framework.types.custom_exceptions.InvalidValueError:
+            if value is invalid.
+        """
+        value = variable._load_value(
+            self._loader, self._loader.get(variable.key, MISSING)
+        )
+        self._values[self._layout[variable]] = value
+        return value
+
+    def validate_all(self) -> None:
+        """
+        Loads and validates values of all variables that weren't
+        accessed yet, so errors in lazy config are found at once.
+        Does nothing for configs that aren't lazy.
+
+        :return: nothing.
+        :raises KeyError: if value wasn't found and there's no default.
+        :raises config_framework.types.custom_exceptions.InvalidValueError:
+            if value is invalid.
+        """
+        variables = [
+            variable for variable, index in self._layout.items()
+            if self._values[index] is NOT_RESOLVED
+        ]
+        raw_values = self._loader.get_many(
+            variable.key for variable in variables
+        )
+        for variable, raw_value in zip(variables, raw_values):
+            self._values[self._layout[variable]] = variable._load_value(
+                self._loader, raw_value
+            )
+
     def __post_init__(self) -> None:
         """
         Function with custom user actions for any purpose.
@@ -38,18 +119,129 @@ class BaseConfig:
         """
         pass
 
-    def __init_subclass__(cls, **kwargs) -> None:
+    def __init_subclass__(
+        cls, coerce: bool = False, compiled_init: Optional[bool] = None,
+        lazy: Optional[bool] = None, **kwargs
+    ) -> None:
         """
-        Function that collects all variables and loaders from inherited config.
+        Function that collects all variables of config, including inherited
+        ones, and gives each of them place in storage of instances.
 
+        :param coerce: if values of variables annotated like Variable[int]
+            must be converted to annotated type, unless variable
+            has its own deserializer.
+        :param compiled_init: if values must be loaded by function generated
+            for this class, that skips default deserializers and
+            validators. Inherited from parent config if not specified.
+        :param lazy: if values must be loaded, deserialized and validated
+            on first access instead of config creation (see validate_all).
+            Inherited from parent config if not specified.
         :kwargs: subclasses kwargs.
         :return: nothing.
         """
-        cls._variables = set()
+        super().__init_subclass__(**kwargs)
+        # Variables are collected by name, so redefined ones are replaced
+        variables: Dict[str, Variable] = {}
+        for klass in reversed(cls.__mro__):
+            for key, value in klass.__dict__.items():
+                if isinstance(value, Variable):
+                    variables[key] = value
+
+                else:
+                    variables.pop(key, None)
+
+        cls._variables = set(variables.values())
+        cls._layout = {
+            variable: index for index, variable in enumerate(
+                dict.fromkeys(variables.values())
+            )
+        }
+
+        if coerce:
+            cls._install_coercers()
 
-        for key, value in cls.__dict__.items():
-            if isinstance(value, Variable):
-                cls._variables.add(value)
+        if lazy is not None:
+            cls._lazy = lazy
+
+        if compiled_init is not None:
+            cls._compiled_init = compiled_init
+
+        if cls._compiled_init:
+            cls._compile_values_loader()
+
+    @classmethod
+    def _compile_values_loader(cls) -> None:
+        # Version is taken first, so registrations made while
+        # compiling cause one more compilation later
+        version = Variable._registrations
+        cls._values_loader = compile_values_loader(cls._layout)
+        cls._values_loader_version = version
+
+    @classmethod
+    def _install_coercers(cls) -> None:
+        try:
+            type_hints: Optional[Dict[str, Any]] = typing.get_type_hints(cls)
+
+        except Exception:
+            # Some annotation can't be resolved, so variables are resolved
+            # one by one to tell which of them is the problem
+            type_hints = None
+
+        for name in cls.__dict__.get("__annotations__", {}):
+            variable = cls.__dict__.get(name)
+            if (
+                not isinstance(variable, Variable)
+                # Registered deserializers are stored in instance
+                or "custom_deserializer" in variable.__dict__
+            ):
+                continue
+
+            annotation = (
+                type_hints[name] if type_hints is not None
+                else cls._resolve_annotation(name)
+            )
+            coercer = compile_coercer(variable_type(annotation))
+            if coercer is not None:
+                variable.register_deserializer(coercing_deserializer(coercer))
+
+    @classmethod
+    def _resolve_annotation(cls, name: str) -> Any:
+        """
+        Gives annotation of attribute of this class, evaluating it
+        if it's a string, like typing.get_type_hints does.
+
+        :param name: name of attribute.
+        :return: annotation.
+        :raises TypeError: if annotation uses names that can't be found,
+            like classes defined in function that makes config.
+        """
+        annotation = cls.__dict__["__annotations__"][name]
+        if not isinstance(annotation, str):
+            return annotation
+
+        module = sys.modules.get(cls.__module__)
+        try:
+            return eval(  # noqa: Same as typing.get_type_hints
+                annotation, getattr(module, "__dict__", {}), dict(vars(cls))
+            )
+
+        except Exception as error:
+            raise TypeError(
+                f"Can't resolve annotation {annotation!r} of {cls.__name__}."
+                f"{name} to coerce its values, names it uses must be "
+                f"defined in module or variable must have its own "
+                f"deserializer"
+            ) from error
+
+    @classmethod
+    def variable_keys(cls) -> List[VariableKey]:
+        """
+        Gives keys of all variables of config, so loaders can
+        load only them (see only_keys parameter of Json.load).
+
+        :return: list of keys.
+        """
+        return [variable.key for variable in cls._variables]
 
     def __setattr__(self, key, value):
         """
@@ -75,12 +267,15 @@ class BaseConfig:
     def save(self, include_defaults: bool = True) -> None:
         """
         Saves updated variables values to some storage using
-            AbstractLoader.dump method.
+            AbstractLoader.save method. Loader is always dumped, since
+            values can be changed directly in containers it gave,
+            but files with same content aren't written again.
 
-        :param include_defaults: if dump of config must include default values.
+        :param include_defaults: if dump of config must include default values,
+            not supported by composite loader.
         :return: nothing.
         """
-        self._loader.dump(include_defaults)
+        self._loader.save(include_defaults, force=True)
 
     def __repr__(self):
         return self.__class__.__name__
@@ -1,3 +1,6 @@
+from typing import Any, List, Tuple
+
+
 class InvalidValueError(ValueError):
     """
     Raised to give traceback about variable validations with more details.
@@ -9,3 +12,35 @@ class ValueValidationError(InvalidValueError):
     Raised if received value that hasn't passed users checks.
     """
     pass
+
+
+class LoadingError(RuntimeError):
+    """
+    Raised if some of config sources couldn't be loaded. Contains all
+    errors that happened, paired with what was being loaded.
+    """
+    errors: List[Tuple[Any, BaseException]]
+
+    def __init__(self, errors: List[Tuple[Any, BaseException]]):
+        self.errors = errors
+        super().__init__(
+            "Couldn't load config sources:\n" + "\n".join(
+                f"{source}: {error!r}" for source, error in errors
+            )
+        )
+
+
+class SavingError(RuntimeError):
+    """
+    Raised if some of config sources couldn't be saved. Contains all
+    errors that happened, paired with loader that was being saved.
+    """
+    errors: List[Tuple[Any, BaseException]]
+
+    def __init__(self, errors: List[Tuple[Any, BaseException]]):
+        self.errors = errors
+        super().__init__(
+            "Couldn't save config sources:\n" + "\n".join(
+                f"{source}: {error!r}" for source, error in errors
+            )
+        )
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
+
+from .custom_exceptions import SavingError
+
+if TYPE_CHECKING:
+    from .abstract.loader import AbstractLoader  # noqa: Used for mypy
+
+
+class DumpScheduler:
+    """
+    Saves loaders in background thread. Many saves of same loader
+    requested in short time are merged into one, which is made after
+    delay seconds passed since the last request, but not later than
+    max_delay seconds after the first one.
+
+    Loaders are copied under their lock before writing, so they can be
+    changed through loader while being saved, and such changes are saved
+    next time. Containers returned by loader must not be changed directly
+    while it's copied.
+    Errors of background saves are raised by the next flush call.
+    """
+    def __init__(self, delay: float = 0.5, max_delay: float = 5.0):
+        """
+        :param delay: how long to wait for more save requests.
+        :param max_delay: longest time save can be postponed for.
+        :return: nothing.
+        """
+        self.delay = delay
+        self.max_delay = max_delay
+        # Loader id mapped to loader, if defaults must be saved
+        # and if it must be saved even if it wasn't changed
+        self._pending: Dict[int, Tuple[AbstractLoader, bool, bool]] = {}
+        self._first_request_at: Optional[float] = None
+        self._last_request_at: float = 0.0
+        self._errors: List[Tuple[Any, BaseException]] = []
+        self._condition = threading.Condition()
+        # Only one save of loaders can be running at once
+        self._saving = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def schedule(
+        self, loader: AbstractLoader, include_defaults: bool = False,
+        force: bool = False
+    ) -> None:
+        """
+        Requests loader to be saved later.
+
+        :param loader: loader to save.
+        :param include_defaults: specifies if
+            you want to have default variables to be dumped.
+        :param force: save loader even if it wasn't changed through it.
+        :return: nothing.
+        """
+        with self._condition:
+            now = monotonic()
+            _, pending_defaults, pending_force = self._pending.get(
+                id(loader), (loader, False, False)
+            )
+            self._pending[id(loader)] = (
+                loader, include_defaults or pending_defaults,
+                force or pending_force
+            )
+            if self._first_request_at is None:
+                self._first_request_at = now
+
+            self._last_request_at = now
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="config-dump-scheduler", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.flush)
+
+            self._condition.notify()
+
+    @property
+    def pending(self) -> int:
+        """
+        Tells how many loaders are waiting to be saved.
+        """
+        return len(self._pending)
+
+    def flush(self, loader: Optional[AbstractLoader] = None) -> None:
+        """
+        Saves waiting loaders right now.
+
+        :param loader: loader to save or None to save every waiting one.
+        :return: nothing.
+        :raises config_framework.types.custom_exceptions.SavingError:
+            with all errors of saves made since previous flush.
+        """
+        with self._saving:
+            with self._condition:
+                if loader is None:
+                    batch = list(self._pending.values())
+                    self._pending.clear()
+
+                else:
+                    item = self._pending.pop(id(loader), None)
+                    batch = [] if item is None else [item]
+
+                if not self._pending:
+                    self._first_request_at = None
+
+            self._save(batch)
+
+        with self._condition:
+            errors, self._errors = self._errors, []
+
+        if errors:
+            raise SavingError(errors)
+
+    def _deadline(self) -> float:
+        assert self._first_request_at is not None
+        return min(
+            self._last_request_at + self.delay,
+            self._first_request_at + self.max_delay
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+
+                remaining = self._deadline() - monotonic()
+                if remaining > 0:
+                    # New requests move deadline, so it's checked again
+                    self._condition.wait(remaining)
+                    continue
+
+            with self._saving:
+                with self._condition:
+                    batch = list(self._pending.values())
+                    self._pending.clear()
+                    self._first_request_at = None
+
+                self._save(batch)
+
+    def _save(self, batch: List[Tuple[AbstractLoader, bool, bool]]) -> None:
+        for loader, include_defaults, force in batch:
+            try:
+                loader._save_now(include_defaults, force, in_background=True)
+
+            except Exception as error:
+                with self._condition:
+                    self._errors.append((loader, error))
+
+
+default_dump_scheduler = DumpScheduler()
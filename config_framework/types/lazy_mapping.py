@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+from typing import (
+    Any, Callable, Dict, Iterator, MutableMapping, Optional
+)
+
+
+class LazyMapping(MutableMapping):
+    """
+    Mapping that gets its content from parse function on first access.
+    Parse function is called only once, even if mapping is accessed
+    from many threads at the same time. If it fails, error is raised
+    to whoever accessed mapping and next access tries again.
+    """
+    _parse: Callable[[], Optional[MutableMapping[str, Any]]]
+    _data: Optional[MutableMapping[str, Any]]
+
+    def __init__(
+        self, parse: Callable[[], Optional[MutableMapping[str, Any]]]
+    ):
+        """
+        :param parse: function giving content of mapping.
+        :return: nothing.
+        """
+        self._parse = parse
+        self._data = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Tells if content was already parsed.
+        """
+        return self._data is not None
+
+    def materialize(self) -> MutableMapping[str, Any]:
+        """
+        Gives parsed content, parsing it if that wasn't done yet.
+
+        :return: parsed content.
+        """
+        data = self._data
+        if data is None:
+            with self._lock:
+                data = self._data
+                if data is None:
+                    data = self._parse()
+                    # Empty files give None
+                    if data is None:
+                        data = {}
+
+                    self._data = data
+
+        return data
+
+    def prefetch(self) -> threading.Thread:
+        """
+        Starts parsing content in background thread. Errors are
+        raised on next access from other threads.
+
+        :return: thread that parses content.
+        """
+        def warm_up() -> None:
+            try:
+                self.materialize()
+
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=warm_up, daemon=True)
+        thread.start()
+        return thread
+
+    def __getitem__(self, key: str) -> Any:
+        return self.materialize()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.materialize()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.materialize()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.materialize()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"{self.__class__.__name__}(<not loaded>)"
+
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Lock can't be copied, so content is parsed right away instead
+        return {"_parse": self._parse, "_data": self.materialize()}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
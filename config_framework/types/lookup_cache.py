@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Any, Dict, NamedTuple, Optional, Mapping, List, Tuple
+
+from .variable_key import KeyPath
+
+NOT_CACHED: Any = object()
+
+
+class LookupCacheStats(NamedTuple):
+    """
+    Snapshot of lookup cache counters.
+    """
+    hits: int
+    misses: int
+    size: int
+
+
+class LookupCache:
+    """
+    Memoizes values resolved by loader under compiled key paths, so
+    repeated reads of the same key are a single dict probe.
+    """
+    values: Dict[KeyPath, Any]
+    hits: int
+    misses: int
+    is_complete: bool = False
+
+    __slots__ = ("values", "hits", "misses")
+
+    def __init__(self):
+        self.values = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: KeyPath) -> Any:
+        """
+        Gives cached value for path.
+
+        :param path: compiled key path.
+        :return: cached value or NOT_CACHED.
+        """
+        value = self.values.get(path, NOT_CACHED)
+        if value is NOT_CACHED:
+            self.misses += 1
+
+        else:
+            self.hits += 1
+
+        return value
+
+    def store(self, path: KeyPath, value: Any) -> None:
+        """
+        Remembers resolved value.
+
+        :param path: compiled key path.
+        :param value: value that was found under this path.
+        :return: nothing.
+        """
+        self.values[path] = value
+
+    def invalidate(
+        self, path: Optional[KeyPath], root: Mapping[str, Any]
+    ) -> None:
+        """
+        Forgets value under path and everything nested in it.
+        Values of parent paths are kept since those are the same
+        containers that were modified in place.
+
+        :param path: compiled key path or None to drop everything.
+        :param root: mapping that paths are resolved from.
+        :return: nothing.
+        """
+        if path is None:
+            self.values.clear()
+            return
+
+        depth = len(path)
+        stale = [
+            cached_path for cached_path in self.values
+            if cached_path[:depth] == path
+        ]
+        for cached_path in stale:
+            del self.values[cached_path]
+
+    @property
+    def stats(self) -> LookupCacheStats:
+        return LookupCacheStats(self.hits, self.misses, len(self.values))
+
+
+class FlatPathIndex(LookupCache):
+    """
+    Lookup cache that is filled in advance with every path of a document,
+    so any key is a single dict probe and a miss means there's no such key.
+    """
+    is_complete: bool = True
+    _pending_root: Optional[Mapping[str, Any]]
+
+    __slots__ = ("_pending_root",)
+
+    def __init__(
+        self, root: Optional[Mapping[str, Any]] = None,
+        deferred: bool = False
+    ):
+        """
+        :param root: mapping that paths are resolved from.
+        :param deferred: build index on first lookup instead of right now.
+        :return: nothing.
+        """
+        super().__init__()
+        self._pending_root = None
+        if root is not None:
+            if deferred:
+                self._pending_root = root
+
+            else:
+                self._index_document(root)
+
+    def get(self, path: KeyPath) -> Any:
+        if self._pending_root is not None:
+            self._index_document(self._pending_root)
+            self._pending_root = None
+
+        return super().get(path)
+
+    def invalidate(
+        self, path: Optional[KeyPath], root: Mapping[str, Any]
+    ) -> None:
+        """
+        Re-indexes value under path and everything nested in it.
+
+        :param path: compiled key path or None to rebuild whole index.
+        :param root: mapping that paths are resolved from.
+        :return: nothing.
+        """
+        if self._pending_root is not None:
+            self._pending_root = root
+            return
+
+        if path is None:
+            self.values.clear()
+            self._index_document(root)
+            return
+
+        # Replaced value isn't modified by itself, so it tells
+        # exactly which paths were indexed under it
+        old_value = self.values.pop(path, NOT_CACHED)
+        if isinstance(old_value, Mapping):
+            stack: List[Tuple[KeyPath, Mapping[str, Any]]] = [
+                (path, old_value)
+            ]
+            while stack:
+                parent_path, container = stack.pop()
+                for key in container:
+                    child_path = parent_path + (key,)
+                    child = self.values.pop(child_path, NOT_CACHED)
+                    if isinstance(child, Mapping):
+                        stack.append((child_path, child))
+
+        value: Any = root
+        for sub_key in path:
+            if not isinstance(value, Mapping) or sub_key not in value:
+                return
+
+            value = value[sub_key]
+
+        self._index_subtree(path, value)
+
+    def _index_document(self, root: Mapping[str, Any]) -> None:
+        """
+        Indexes every value of a document.
+
+        :param root: mapping that paths are resolved from.
+        :return: nothing.
+        """
+        for key, value in root.items():
+            if isinstance(key, str):
+                self._index_subtree((key,), value)
+
+    def _index_subtree(self, path: KeyPath, value: Any) -> None:
+        """
+        Adds value and everything nested in it to index.
+
+        :param path: path of value.
+        :param value: any value.
+        :return: nothing.
+        """
+        values = self.values
+        stack: List[Tuple[KeyPath, Any]] = [(path, value)]
+        while stack:
+            current_path, current = stack.pop()
+            values[current_path] = current
+            if isinstance(current, Mapping):
+                for key, child in current.items():
+                    if isinstance(key, str):
+                        stack.append((current_path + (key,), child))
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections import ChainMap
+from typing import Any, Hashable, Iterator, Mapping, Optional, Set
+
+
+class MergedView(ChainMap):
+    """
+    ChainMap that doesn't build union of keys of all its mappings on
+    every len and iter call. When only one mapping has keys, it's used
+    as is, otherwise keys are walked without making new dict.
+
+    Mappings inside can be changed directly, since nothing about their
+    keys is remembered.
+    """
+    def __init__(self, *maps: Mapping[Any, Any]):
+        super().__init__(*maps)  # type: ignore
+
+    def _only_filled(self) -> Optional[Mapping[Any, Any]]:
+        """
+        Gives the only mapping with keys.
+
+        :return: mapping or None if more than one mapping has keys.
+        """
+        filled: Optional[Mapping[Any, Any]] = None
+        for mapping in self.maps:
+            if not mapping:
+                continue
+
+            if filled is not None:
+                return None
+
+            filled = mapping
+
+        return {} if filled is None else filled
+
+    def __getitem__(self, key: Hashable) -> Any:
+        for mapping in self.maps:
+            if key in mapping:
+                return mapping[key]
+
+        return self.__missing__(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        for mapping in self.maps:
+            if key in mapping:
+                return mapping[key]
+
+        return default
+
+    def __len__(self) -> int:
+        filled = self._only_filled()
+        if filled is not None:
+            return len(filled)
+
+        return sum(1 for _ in self._merged_keys())
+
+    def __iter__(self) -> Iterator[Any]:
+        filled = self._only_filled()
+        if filled is not None:
+            return iter(filled)
+
+        return self._merged_keys()
+
+    def _merged_keys(self) -> Iterator[Any]:
+        # Same order as ChainMap gives
+        seen: Set[Hashable] = set()
+        for mapping in reversed(self.maps):
+            for key in mapping:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in mapping for mapping in self.maps)
+
+    def __bool__(self) -> bool:
+        return any(self.maps)
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import copy
 from typing import (
     TypeVar, Generic, Optional,
     Union, Any, TYPE_CHECKING,
-    Type, Callable, overload
+    Type, Callable, ClassVar, cast, overload
 )
 
 from . import custom_exceptions
-from .abstract.loader import AbstractLoader
+from .abstract.loader import AbstractLoader, MISSING
 from .variable_key import VariableKey
 
 if TYPE_CHECKING:
@@ -21,9 +22,29 @@ CustomDeserializer = Callable[["Variable", Any], Var]
 CustomValidator = Callable[["Variable", Var], bool]
 
 
+class _NotResolved:
+    """
+    Marks values of lazy configs that weren't loaded yet.
+    """
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "NOT_RESOLVED"
+
+
+NOT_RESOLVED: Any = _NotResolved()
+
+
 class Variable(Generic[Var]):
+    # Loader value was loaded from and that value for variables used
+    # outside of config, variables of configs keep values of each config
+    # instance in its storage and give copies with source set to its
+    # loader to custom functions
     source: Optional[AbstractLoader]
     _value: Var
+    # Changed on every registration of custom functions, so code
+    # generated from variables knows it must be built again
+    _registrations: ClassVar[int] = 0
 
     def __init__(
         self,
@@ -62,36 +83,65 @@ class Variable(Generic[Var]):
         :param instance: if it is None then you will receive Variable instance.
             If it's not - you will get just a value inside of Variable.
         :param cls: class from which variable was called.
-        returns: Variable._value or Variable instance, depending on conditions,
-            explained previously.
+        returns: value from storage of config instance (or Variable._value
+            if variable isn't part of config) or Variable instance,
+            depending on conditions, explained previously.
         :raises ValueError: if there are no defaults or
         """
-        if instance:
-            try:
-                return self._value
+        if instance is None:
+            return self
+
+        config = cast("BaseConfig", instance)
+        try:
+            values = config._values
 
-            except AttributeError:
-                if self.default is not None:
-                    return self.default
+        except AttributeError:
+            # Variable used outside of config keeps value by itself
+            return self._get_own_value()
 
-                raise ValueError(f"No variable value set for variable with key {self.key}")
+        value = values[config._layout[self]]
+        if value is NOT_RESOLVED:
+            return config._resolve(self)
 
-        else:
-            return self
+        if value is MISSING:
+            return self._get_default()
+
+        return value
 
     def __set__(self, obj: Optional[object], value: Var) -> None:
         """
         Sets a new value to your variable.
 
         :param obj: object from which method was called.
-        :param value: which value will be assigned to _value field.
+        :param value: which value will be assigned to _value field
+            or to storage of config instance.
         :raises config_framework.types.custom_exceptions.ValueValidationError:
             adds explanation on where is invalid value in your config and
             from which loader value is from. This contains also a traceback
             to your config_framework.types.custom_exceptions.InvalidValueError.
         """
         self.validate_value(value)
-        self._value = value
+        try:
+            values = obj._values  # type: ignore
+
+        except AttributeError:
+            self._value = value
+            return
+
+        values[obj._layout[self]] = value  # type: ignore
+
+    def _get_own_value(self) -> Var:
+        try:
+            return self._value
+
+        except AttributeError:
+            return self._get_default()
+
+    def _get_default(self) -> Var:
+        if self.default is not None:
+            return self.default
+
+        raise ValueError(f"No variable value set for variable with key {self.key}")
 
     def _set_value_from_loader(self, loader: AbstractLoader) -> None:
         """
@@ -101,25 +151,84 @@ class Variable(Generic[Var]):
         :param loader:
         :return:
         """
+        self._set_loaded_value(loader, loader.get(self.key, MISSING))
+
+    def _set_loaded_value(self, loader: AbstractLoader, raw_value: Any) -> None:
+        """
+        Sets value that was already fetched from loader, falling back
+        to default if loader didn't have it.
+
+        :param loader: loader from which value is taken.
+        :param raw_value: raw value from loader or MISSING.
+        :return: nothing.
+        :raises KeyError: if value wasn't found and there's no default.
+        """
+        self._value = self._load_value(loader, raw_value)
         self.source = loader
-        if not self.default:
-            value = self.deserialize(loader[self.key])
 
-        else:
-            value = self.deserialize(loader.get(self.key, self.default))
+    def _load_value(self, loader: AbstractLoader, raw_value: Any) -> Var:
+        """
+        Gives deserialized and validated value that was fetched from loader,
+        without storing it anywhere.
+
+        :param loader: loader from which value is taken.
+        :param raw_value: raw value from loader or MISSING.
+        :return: value of variable.
+        :raises KeyError: if value wasn't found and there's no default.
+        """
+        if raw_value is MISSING:
+            if not self.default:
+                raise KeyError(
+                    f"Couldn't find any value using key: {self.key}"
+                )
 
-        self.__set__(self, value)
+            raw_value = self.default
+
+        if not self._has_custom_loading():
+            return self.deserialize(raw_value)
+
+        return self._with_source(loader).deserialize(raw_value)
+
+    def _has_custom_loading(self) -> bool:
+        # Default deserializer and validator don't look at source
+        return (
+            self.custom_deserializer is not Variable.custom_deserializer
+            or self.custom_validator is not Variable.custom_validator
+        )
+
+    def _with_source(self, loader: AbstractLoader) -> Variable[Var]:
+        """
+        Gives copy of variable with source set to loader, so values of
+        configs with other loaders can be handled at the same time.
+
+        :param loader: loader that value is taken from or saved to.
+        :return: copy of variable.
+        """
+        bound_variable = copy.copy(self)
+        bound_variable.source = loader
+        return bound_variable
 
     def serialize(
-        self: Variable
+        self: Variable,
+        instance: Optional[BaseConfig] = None
     ) -> Any:  # noqa:
         # Might be used by other functions.
         """
         Casts variables value to specific loaders type, so it can be saved.
 
+        :param instance: config which value must be serialized, so
+            serializer gets loader of that config as source of variable.
+            Value of variable used outside of config is serialized
+            if not given.
         :returns: anything.
         """
-        return self.custom_serializer(self, self._value)
+        if instance is None:
+            return self.custom_serializer(self, self._get_own_value())
+
+        value = self.__get__(instance, type(instance))
+        return self.custom_serializer(
+            self._with_source(instance._loader), value
+        )
 
     def deserialize(
         self,
@@ -240,6 +349,7 @@ class Variable(Generic[Var]):
         :return: function itself.
         """
         setattr(self, "custom_validator", f)
+        Variable._registrations += 1
         # Validating already existing value with new validator
         if self.default is not None:
             self.validate_value(self.default)
@@ -259,6 +369,7 @@ class Variable(Generic[Var]):
         :return: function itself.
         """
         setattr(self, "custom_serializer", f)
+        Variable._registrations += 1
         return f
 
     def register_deserializer(
@@ -272,4 +383,5 @@ class Variable(Generic[Var]):
         :return: function itself.
         """
         setattr(self, "custom_deserializer", f)
+        Variable._registrations += 1
         return f
@@ -1,17 +1,92 @@
 from __future__ import annotations
 
-from typing import Iterable, Union, Iterator, List
+import sys
+import weakref
+from functools import lru_cache
+from typing import Iterable, Union, Iterator, List, Optional, Tuple
+
+KeyPath = Tuple[str, ...]
+KeyLike = Union["VariableKey", str, KeyPath]
+
+# How many distinct paths are kept interned, least recently used
+# paths are dropped, so table doesn't grow with every looked up path.
+INTERNED_PATHS_LIMIT = 4096
+
+
+@lru_cache(maxsize=INTERNED_PATHS_LIMIT)
+def _interned_path(path: KeyPath) -> KeyPath:
+    # Cache gives back the first of equal paths it has seen
+    return path
+
+
+def intern_path(pieces: Iterable[str]) -> KeyPath:
+    """
+    Builds an interned tuple out of key pieces.
+
+    :param pieces: parts of a key.
+    :return: tuple that is shared between all equal paths
+        while it stays among recently used ones.
+    """
+    return _interned_path(tuple(sys.intern(piece) for piece in pieces))
+
+
+def compile_key(key: KeyLike) -> KeyPath:
+    """
+    Gives flat tuple form of any key that loaders accept.
+
+    :param key: VariableKey, string or already compiled path.
+    :return: tuple of key pieces.
+    :raises TypeError: if received unsupported key type.
+    :raises ValueError: if received empty path.
+    """
+    if isinstance(key, VariableKey):
+        return key.path
+
+    if isinstance(key, str):
+        return (key,)
+
+    if isinstance(key, tuple):
+        if not key:
+            raise ValueError("Key path must have at least one piece: got ()")
+
+        return key
+
+    raise TypeError(
+        "Invalid key type provided (must be str or VariableKey): "
+        f"got {type(key)}"
+    )
+
+
+def format_path(path: KeyPath) -> str:
+    """
+    Gives the same representation of path as str(VariableKey) does.
+
+    :param path: compiled path.
+    :return: string.
+    """
+    return "[/]".join(path)
 
 
 class VariableKey(Iterable):
     """
     Class that helps us organize how keys for config variables
     to look for inside some complicated nested structures.
+
+    Flat form of a key is computed once and cached together with its
+    hash and string representation. Cache is dropped whenever this key
+    or any key that was appended to it gets extended, so keys that are
+    already used in sets or as dict keys must not be extended.
     """
     root_key: str
     next_pieces: List[VariableKey]
+    _path: Optional[KeyPath]
+    _hash: Optional[int]
+    _str: Optional[str]
 
-    __slots__ = ("root_key", "next_pieces")
+    __slots__ = (
+        "root_key", "next_pieces", "_path", "_hash", "_str",
+        "_parents", "__weakref__"
+    )
 
     def __init__(self, root_key: str):
         """
@@ -29,6 +104,8 @@ class VariableKey(Iterable):
 
         self.root_key = root_key
         self.next_pieces = []
+        self._parents: List[weakref.ReferenceType] = []
+        self._invalidate()
 
     def __truediv__(self, other_key: Union[str, VariableKey]) -> VariableKey:
         """
@@ -46,6 +123,7 @@ class VariableKey(Iterable):
 
         elif isinstance(other_key, type(self)):
             self.next_pieces.append(other_key)
+            other_key._parents.append(weakref.ref(self))
 
         else:
             raise TypeError(
@@ -53,8 +131,49 @@ class VariableKey(Iterable):
                 f"got {type(other_key)}"
             )
 
+        self._invalidate()
         return self
 
+    @property
+    def path(self) -> KeyPath:
+        """
+        Flat and interned tuple form of this key.
+
+        :return: tuple of key pieces.
+        """
+        path: Optional[KeyPath] = self._path
+        if path is None:
+            pieces: List[str] = [self.root_key]
+            for next_piece in self.next_pieces:
+                pieces.extend(next_piece.path)
+
+            path = self._path = intern_path(pieces)
+
+        return path
+
+    def _invalidate(self) -> None:
+        """
+        Drops cached forms of this key and of every key it's part of.
+
+        :return: nothing.
+        """
+        self._path = None
+        self._hash = None
+        self._str = None
+
+        alive_parents = []
+        for parent_ref in self._parents:
+            parent: Optional[VariableKey] = parent_ref()
+            if parent is None:
+                continue
+
+            alive_parents.append(parent_ref)
+            # Parent can only have valid cache if this key had one
+            if parent._path is not None:
+                parent._invalidate()
+
+        self._parents = alive_parents
+
     def __iter__(self) -> Iterator[str]:
         """
         Gives iterable that will yield parts of a full key that will
@@ -62,11 +181,27 @@ class VariableKey(Iterable):
 
         :return: string.
         """
-        yield self.root_key
+        return iter(self.path)
 
-        if self.next_pieces:
-            for next_piece in self.next_pieces:
-                yield from next_piece
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, VariableKey):
+            return self.path is other.path or self.path == other.path
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        key_hash: Optional[int] = self._hash
+        if key_hash is None:
+            key_hash = self._hash = hash(self.path)
+
+        return key_hash
 
     def __str__(self) -> str:
-        return "[/]".join(iter(self))
+        key_str: Optional[str] = self._str
+        if key_str is None:
+            key_str = self._str = format_path(self.path)
+
+        return key_str
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
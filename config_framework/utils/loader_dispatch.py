@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Dict, Union, Type, Callable, Generic, TypeVar
+
+from config_framework.types.abstract import AbstractLoader
+
+Handler = TypeVar("Handler", bound=Callable)
+
+
+class LoaderDispatchTable(Generic[Handler]):
+    """
+    Class that picks function registered for a loader type. Subclasses of
+    registered loaders get function of their closest registered parent,
+    and result is remembered for each loader type. Remembered results
+    are dropped once registered functions are changed, even if dictionary
+    is changed in place.
+    """
+    def __init__(self, handlers: Dict[
+        Union[str, Type[AbstractLoader]],
+        Handler
+    ]):
+        """
+        :param handlers: dictionary of loaders (or * as any not fitting)
+            mapped to their functions.
+        :return: nothing.
+        """
+        self.handlers = handlers
+        # Copy of handlers that remembered results were found with
+        self._resolved_from: Dict[
+            Union[str, Type[AbstractLoader]],
+            Handler
+        ] = dict(handlers)
+        self._resolved: Dict[type, Handler] = {}
+
+    def resolve(self, loader_type: type) -> Handler:
+        """
+        Gives function for specific loader type.
+
+        :param loader_type: type of loader.
+        :return: function registered for it.
+        :raises KeyError: if nothing is registered for this type,
+            any of its parents and there's no default one.
+        """
+        # Comparing few registered functions is cheaper than finding one
+        if self._resolved_from != self.handlers:
+            self._resolved_from = dict(self.handlers)
+            self._resolved.clear()
+
+        handler = self._resolved.get(loader_type)
+        if handler is not None:
+            return handler
+
+        for parent_type in loader_type.__mro__:
+            if parent_type in self.handlers:
+                handler = self.handlers[parent_type]
+                break
+
+        else:
+            # Also raises KeyError if there's no default one
+            handler = self.handlers['*']
+
+        self._resolved[loader_type] = handler
+        return handler
@@ -6,6 +6,7 @@ from config_framework.loaders.composite import Composite
 from config_framework.types import Variable
 from config_framework.types.abstract import AbstractLoader
 from config_framework.types.variable import Var, CustomDeserializer
+from config_framework.utils.loader_dispatch import LoaderDispatchTable
 
 
 class LoaderSpecificDeserializer:
@@ -22,10 +23,24 @@ class LoaderSpecificDeserializer:
             mapped to their deserializers.
         :return: nothing.
         """
-        self.deserializers: Dict[
-            Union[str, Type[AbstractLoader]],
-            CustomDeserializer
-        ] = deserializers
+        self.deserializers = deserializers
+
+    @property
+    def deserializers(self) -> Dict[
+        Union[str, Type[AbstractLoader]],
+        CustomDeserializer
+    ]:
+        """
+        Registered deserializers, that can be changed in place.
+        """
+        return self._dispatch_table.handlers
+
+    @deserializers.setter
+    def deserializers(self, deserializers: Dict[
+        Union[str, Type[AbstractLoader]],
+        CustomDeserializer
+    ]) -> None:
+        self._dispatch_table = LoaderDispatchTable(deserializers)
 
     def __call__(
         self,
@@ -52,15 +67,9 @@ class LoaderSpecificDeserializer:
             )
 
         try:
-            if '*' in self.deserializers:
-                deserializer: CustomDeserializer = self.deserializers.get(
-                    type(cast_from_loader), self.deserializers['*']
-                )
-
-            else:
-                deserializer = self.deserializers[
-                    type(cast_from_loader)
-                ]
+            deserializer: CustomDeserializer = self._dispatch_table.resolve(
+                type(cast_from_loader)
+            )
 
         except KeyError:
             raise KeyError(
@@ -85,17 +94,10 @@ class LoaderSpecificDeserializer:
         :param composite_loader: some composite loader.
         :return: loader instance.
         """
-        for loader in composite_loader.loaders:
-            try:
-                loader[variable.key]
-
-            except KeyError:
-                continue
-
-            else:
-                return loader
+        try:
+            return composite_loader.source_of(variable.key)
 
-        else:
+        except KeyError as key_error:
             raise ValueError(
                 f"{variable} isn't taken from {composite_loader}"
-            )
+            ) from key_error
@@ -6,6 +6,7 @@ from config_framework.loaders.composite import Composite
 from config_framework.types import Variable
 from config_framework.types.abstract import AbstractLoader
 from config_framework.types.variable import Var, CustomSerializer
+from config_framework.utils.loader_dispatch import LoaderDispatchTable
 
 
 class LoaderSpecificSerializer:
@@ -22,10 +23,24 @@ class LoaderSpecificSerializer:
             mapped to their deserializers.
         :return: nothing.
         """
-        self.serializers: Dict[
-            Union[str, Type[AbstractLoader]],
-            CustomSerializer
-        ] = serializers
+        self.serializers = serializers
+
+    @property
+    def serializers(self) -> Dict[
+        Union[str, Type[AbstractLoader]],
+        CustomSerializer
+    ]:
+        """
+        Registered serializers, that can be changed in place.
+        """
+        return self._dispatch_table.handlers
+
+    @serializers.setter
+    def serializers(self, serializers: Dict[
+        Union[str, Type[AbstractLoader]],
+        CustomSerializer
+    ]) -> None:
+        self._dispatch_table = LoaderDispatchTable(serializers)
 
     def __call__(
         self,
@@ -50,15 +65,9 @@ class LoaderSpecificSerializer:
             )
 
         try:
-            if '*' in self.serializers:
-                serializer: CustomSerializer = self.serializers.get(
-                    type(cast_for_loader), self.serializers['*']
-                )
-
-            else:
-                serializer = self.serializers[
-                    type(cast_for_loader)
-                ]
+            serializer: CustomSerializer = self._dispatch_table.resolve(
+                type(cast_for_loader)
+            )
 
         except KeyError:
             raise KeyError(
@@ -78,17 +87,10 @@ class LoaderSpecificSerializer:
         :param composite_loader: some composite loader.
         :return: loader instance.
         """
-        for loader in composite_loader.loaders:
-            try:
-                loader[variable.key]
-
-            except KeyError:
-                continue
-
-            else:
-                return loader
+        try:
+            return composite_loader.source_of(variable.key)
 
-        else:
+        except KeyError as key_error:
             raise ValueError(
                 f"{variable} isn't taken from {composite_loader}"
-            )
+            ) from key_error
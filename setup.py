@@ -24,7 +24,7 @@ setuptools.setup(
     package_data={"config_framework": ["py.typed"]},
     install_requires=requirements,
     extras_require={
-        "toml": ["toml"],
+        "toml": ["toml", "tomlkit"],
         'mypy': ["mypy", "types-PyYAML", "types-toml"],
         'dev': dev_requirements
     },
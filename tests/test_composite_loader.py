@@ -1,7 +1,8 @@
+import asyncio
 import unittest
 import copy
 
-from config_framework import loaders
+from config_framework import loaders, VariableKey, types
 
 
 class TestCompositeLoader(unittest.TestCase):
@@ -116,6 +117,213 @@ class TestCompositeLoader(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.composite_loader['keys'] = 123
 
+    def test_source_of_value(self):
+        self.assertIs(self.composite_loader.source_of("Some key"), self.loader_1)
+        self.assertIs(self.composite_loader.source_of("Other key"), self.loader_2)
+        with self.assertRaises(KeyError):
+            self.composite_loader.source_of("pi")
+
+    def test_source_of_value_follows_changes(self):
+        loader_1 = copy.deepcopy(self.loader_1)
+        loader_2 = copy.deepcopy(self.loader_2)
+        composite_loader: loaders.Composite = loaders.Composite.load(
+            loader_1, loader_2,
+        )
+        self.assertIs(composite_loader.source_of("Some key"), loader_1)
+
+        del loader_1["Some key"]
+        self.assertIs(composite_loader.source_of("Some key"), loader_2)
+
     def test_deleting_missing_key(self):
         with self.assertRaises(KeyError):
             del self.composite_loader["Not a key"]
+
+    def test_lookup_cache_sees_changes_of_child_loaders(self):
+        loader_1 = copy.deepcopy(self.loader_1)
+        loader_2 = copy.deepcopy(self.loader_2)
+        composite_loader: loaders.Composite = loaders.Composite.load(
+            loader_1, loader_2,
+        )
+        composite_loader.enable_lookup_cache()
+
+        self.assertEqual(composite_loader["Other key"], "testing order")
+        loader_2["Other key"] = "changed"
+        self.assertEqual(composite_loader["Other key"], "changed")
+
+    def test_merged_keys(self):
+        self.assertEqual(
+            set(self.composite_loader),
+            {"Hello world", "Some key", "Other key", "pi"}
+        )
+        self.assertEqual(len(self.composite_loader), 4)
+        self.assertIn("Other key", self.composite_loader)
+
+    def test_merged_keys_follow_child_changes(self):
+        loader_1 = copy.deepcopy(self.loader_1)
+        loader_2 = copy.deepcopy(self.loader_2)
+        composite_loader: loaders.Composite = loaders.Composite.load(
+            loader_1, loader_2,
+        )
+        self.assertEqual(len(composite_loader), 3)
+
+        del loader_2["Other key"]
+        self.assertEqual(len(composite_loader), 2)
+        self.assertNotIn("Other key", composite_loader)
+
+        # Still provided by first loader
+        del loader_2["Some key"]
+        self.assertIn("Some key", composite_loader)
+
+    def test_merged_keys_follow_direct_changes(self):
+        loader_1 = copy.deepcopy(self.loader_1)
+        loader_2 = copy.deepcopy(self.loader_2)
+        composite_loader: loaders.Composite = loaders.Composite.load(
+            loader_1, loader_2,
+        )
+        list(composite_loader)
+
+        loader_2.data["New key"] = 1
+        del loader_2.data["Other key"]
+        self.assertEqual(
+            set(dict(composite_loader)),
+            {"Hello world", "Some key", "New key"}
+        )
+
+        loader = loaders.Dict.load({"a": 1})
+        list(loader)
+        loader.data["b"] = 2
+        del loader.data["a"]
+        self.assertEqual(dict(loader), {"b": 2})
+
+    def test_parallel_loading(self):
+        composite_loader = loaders.Composite.load_parallel(
+            loaders.LoaderSpec(loaders.JsonString, ('{"key": 1}',)),
+            loaders.LoaderSpec(
+                loaders.JsonString, ('{"key": 2, "other key": 3}',)
+            ),
+            loaders.LoaderSpec(loaders.Dict, kwargs={"data": {"dict key": 4}}),
+        )
+
+        self.assertEqual(composite_loader["key"], 1)
+        self.assertEqual(composite_loader["other key"], 3)
+        self.assertEqual(composite_loader["dict key"], 4)
+
+    def test_parallel_loading_in_processes(self):
+        composite_loader = loaders.Composite.load_parallel(
+            loaders.LoaderSpec(loaders.JsonString, ('{"key": 1}',)),
+            loaders.LoaderSpec(loaders.JsonString, ('{"other key": 2}',)),
+            use_processes=True,
+            max_workers=2
+        )
+
+        self.assertEqual(composite_loader["key"], 1)
+        self.assertEqual(composite_loader["other key"], 2)
+
+    def test_parallel_loading_errors(self):
+        with self.assertRaises(types.custom_exceptions.LoadingError) as error:
+            loaders.Composite.load_parallel(
+                loaders.LoaderSpec(loaders.JsonString, ('{"key": 1',)),
+                loaders.LoaderSpec(loaders.JsonString, ('{"key": 1}',)),
+                loaders.LoaderSpec(loaders.JsonString, ('not json',)),
+            )
+
+        self.assertEqual(len(error.exception.errors), 2)
+
+    def test_async_loading(self):
+        composite_loader = asyncio.run(
+            loaders.Composite.aload(
+                loaders.LoaderSpec(loaders.JsonString, ('{"key": 1}',)),
+                loaders.JsonString.aload('{"key": 2, "other key": 3}'),
+                self.loader_1
+            )
+        )
+
+        self.assertEqual(composite_loader["key"], 1)
+        self.assertEqual(composite_loader["other key"], 3)
+        self.assertEqual(composite_loader["Hello world"], "Rud is here")
+
+    def test_async_loading_errors(self):
+        with self.assertRaises(types.custom_exceptions.LoadingError) as error:
+            asyncio.run(
+                loaders.Composite.aload(
+                    loaders.LoaderSpec(loaders.JsonString, ('{"key": 1',)),
+                    loaders.JsonString.aload('not json'),
+                )
+            )
+
+        self.assertEqual(len(error.exception.errors), 2)
+
+    def test_saving_only_changed_loaders(self):
+        first = loaders.Dict.load({"first": 1})
+        second = loaders.Dict.load({"second": 2})
+        composite_loader = loaders.Composite.load(first, second)
+        self.assertFalse(composite_loader.save())
+
+        composite_loader["second"] = 3
+        self.assertTrue(second.is_dirty)
+        self.assertFalse(first.is_dirty)
+        self.assertTrue(composite_loader.save())
+        self.assertFalse(composite_loader.is_dirty)
+
+
+class TestDeepMergeCompositeLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.overlay: loaders.Dict = loaders.Dict.load(
+            {
+                "db": {"host": "overlay.host"},
+                "debug": True
+            }
+        )
+        self.base: loaders.Dict = loaders.Dict.load(
+            {
+                "db": {"host": "base.host", "port": 5432},
+                "debug": {"level": 1}
+            }
+        )
+        self.composite_loader: loaders.Composite = loaders.Composite.load(
+            self.overlay, self.base, deep_merge=True
+        )
+
+    def test_nested_sections_are_merged(self):
+        self.assertEqual(
+            self.composite_loader["db"],
+            {"host": "overlay.host", "port": 5432}
+        )
+        # Plain value of higher priority loader shadows whole section
+        self.assertEqual(self.composite_loader["debug"], True)
+
+    def test_updating_values(self):
+        self.composite_loader[VariableKey("db") / "port"] = 6543
+        self.composite_loader[VariableKey("db") / "host"] = "new.host"
+
+        self.assertEqual(self.base[VariableKey("db") / "port"], 6543)
+        self.assertEqual(self.overlay[VariableKey("db") / "host"], "new.host")
+        self.assertEqual(
+            self.base[VariableKey("db") / "host"], "base.host"
+        )
+
+    def test_changes_of_child_loaders_are_merged(self):
+        del self.overlay[VariableKey("db") / "host"]
+        self.assertEqual(
+            self.composite_loader[VariableKey("db") / "host"], "base.host"
+        )
+
+        del self.overlay["debug"]
+        self.assertEqual(
+            self.composite_loader[VariableKey("debug") / "level"], 1
+        )
+
+    def test_source_of_value(self):
+        self.assertIs(
+            self.composite_loader.source_of(VariableKey("db") / "host"),
+            self.overlay
+        )
+        self.assertIs(
+            self.composite_loader.source_of(VariableKey("db") / "port"),
+            self.base
+        )
+
+    def test_deleting_values(self):
+        del self.composite_loader[VariableKey("db") / "host"]
+        with self.assertRaises(KeyError):
+            host = self.composite_loader[VariableKey("db") / "host"]
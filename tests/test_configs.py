@@ -1,11 +1,14 @@
 import copy
+import json
 import unittest
-from typing import Any, Tuple
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from config_framework import (
     VariableKey, BaseConfig, loaders,
     Variable, types
 )
+from tests.utils import TempFile
 
 
 class TestConfig(unittest.TestCase):
@@ -150,3 +153,197 @@ class TestConfig(unittest.TestCase):
             return version
         python._set_value_from_loader(config_data)
         self.assertEqual(config_data['python'], python.serialize())
+
+    def test_variable_keys(self):
+        self.assertEqual(
+            set(self.ConfigClass.variable_keys()),
+            {
+                VariableKey("rud"), VariableKey("is author"),
+                VariableKey("nested") / "data"
+            }
+        )
+
+    def test_defaults_of_missing_values(self):
+        config_data = loaders.Dict.load({"nested": {"data": "value"}})
+
+        class Config(BaseConfig):
+            nested_data: Variable[str] = Variable(VariableKey("nested") / "data")
+            optional: Variable[int] = Variable(VariableKey("nested") / "optional", default=42)
+
+        conf = Config(config_data)
+        self.assertEqual(conf.nested_data, "value")
+        self.assertEqual(conf.optional, 42)
+
+    def test_missing_required_value(self):
+        config_data = loaders.Dict.load({"nested": {}})
+
+        class Config(BaseConfig):
+            nested_data: Variable[str] = Variable(VariableKey("nested") / "data")
+
+        with self.assertRaises(KeyError):
+            Config(config_data)
+
+    def test_coercion_from_annotations(self):
+        config_data = loaders.Dict.load(
+            {
+                "port": "8080", "debug": "yes", "hosts": "a, b",
+                "timeout": "1m30s", "limits": '{"cpu": "2"}',
+                "ratio": "0.5", "custom": "7"
+            }
+        )
+
+        class Config(BaseConfig, coerce=True):
+            port: Variable[int] = Variable("port")
+            debug: Variable[bool] = Variable("debug")
+            hosts: Variable[List[str]] = Variable("hosts")
+            timeout: Variable[timedelta] = Variable("timeout")
+            limits: Variable[Dict[str, int]] = Variable("limits")
+            ratio: Variable[Optional[float]] = Variable("ratio")
+            retries: Variable[Optional[int]] = Variable("retries", default=3)
+            custom: Variable[int] = Variable("custom")
+
+            @staticmethod
+            @custom.register_deserializer
+            def deserialize_custom(variable: Variable, value: Any):
+                return value * 2
+
+        conf = Config(config_data)
+        self.assertEqual(conf.port, 8080)
+        self.assertIs(conf.debug, True)
+        self.assertEqual(conf.hosts, ["a", "b"])
+        self.assertEqual(conf.timeout, timedelta(seconds=90))
+        self.assertEqual(conf.limits, {"cpu": 2})
+        self.assertEqual(conf.ratio, 0.5)
+        self.assertEqual(conf.retries, 3)
+        # Registered deserializers aren't replaced
+        self.assertEqual(conf.custom, "77")
+
+    def test_coercion_of_invalid_value(self):
+        config_data = loaders.Dict.load({"port": "http"})
+
+        class Config(BaseConfig, coerce=True):
+            port: Variable[int] = Variable("port")
+
+        with self.assertRaises(types.custom_exceptions.InvalidValueError):
+            Config(config_data)
+
+    def test_coercion_of_unresolved_annotation(self):
+        class Port(int):
+            pass
+
+        # Like annotations of module using "from __future__ import annotations"
+        with self.assertRaises(TypeError):
+            class Config(BaseConfig, coerce=True):
+                port: "Variable[Port]" = Variable("port")
+
+        class ConfigWithDeserializer(BaseConfig, coerce=True):
+            port: "Variable[Port]" = Variable("port")
+
+            @staticmethod
+            @port.register_deserializer
+            def deserialize_port(variable: Variable, value: Any):
+                return Port(value)
+
+        conf = ConfigWithDeserializer(loaders.Dict.load({"port": "80"}))
+        self.assertEqual(conf.port, 80)
+
+    def test_no_coercion_by_default(self):
+        config_data = loaders.Dict.load({"port": "8080"})
+
+        class Config(BaseConfig):
+            port: Variable[int] = Variable("port")
+
+        self.assertEqual(Config(config_data).port, "8080")
+
+    def test_values_of_many_instances(self):
+        class Config(BaseConfig):
+            __slots__ = ()
+            tenant: Variable[str] = Variable("tenant")
+
+        first = Config(loaders.Dict.load({"tenant": "first"}))
+        second = Config(loaders.Dict.load({"tenant": "second"}))
+
+        self.assertEqual(first.tenant, "first")
+        self.assertEqual(second.tenant, "second")
+        self.assertFalse(hasattr(first, "__dict__"))
+
+    def test_inherited_variables(self):
+        config_data = loaders.Dict.load({"name": "app", "port": 80, "debug": 1})
+
+        class Config(BaseConfig):
+            name: Variable[str] = Variable("name")
+            port: Variable[int] = Variable("port")
+
+        class ChildConfig(Config):
+            port: Variable[int] = Variable("port", default=8080)
+            debug: Variable[int] = Variable("debug")
+
+        conf = ChildConfig(config_data)
+        self.assertEqual((conf.name, conf.port, conf.debug), ("app", 80, 1))
+        self.assertEqual(len(ChildConfig._variables), 3)
+
+    def test_compiled_init(self):
+        config_data = loaders.Dict.load({"port": "80", "name": "app"})
+
+        class Config(BaseConfig, coerce=True, compiled_init=True):
+            port: Variable[int] = Variable("port")
+            name: Variable[str] = Variable("name")
+            mode: Variable[str] = Variable("mode", default="dev")
+
+        conf = Config(config_data)
+        self.assertEqual((conf.port, conf.name, conf.mode), (80, "app", "dev"))
+
+        # Functions registered after class creation are used too
+        @Config.name.register_validator
+        def validate_name(variable: Variable, value: Any):
+            if value != "app":
+                raise types.custom_exceptions.ValueValidationError()
+
+            return True
+
+        with self.assertRaises(types.custom_exceptions.InvalidValueError):
+            Config(loaders.Dict.load({"port": 80, "name": "other"}))
+
+        with self.assertRaises(KeyError):
+            Config(loaders.Dict.load({"name": "app"}))
+
+    def test_lazy_config(self):
+        config_data = loaders.Dict.load({"port": "http", "name": "app"})
+
+        class Config(BaseConfig, coerce=True, lazy=True):
+            port: Variable[int] = Variable("port")
+            name: Variable[str] = Variable("name")
+            missing: Variable[str] = Variable("missing")
+
+        # Invalid and missing values aren't loaded until they're used
+        conf = Config(config_data)
+        self.assertEqual(conf.name, "app")
+
+        with self.assertRaises(types.custom_exceptions.InvalidValueError):
+            conf.port
+
+        with self.assertRaises(KeyError):
+            conf.missing
+
+        with self.assertRaises(types.custom_exceptions.InvalidValueError):
+            conf.validate_all()
+
+        conf = Config(loaders.Dict.load({"port": "80", "missing": "x"}))
+        with self.assertRaises(KeyError):
+            conf.validate_all()
+
+    def test_saving_changes_of_nested_values(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"db": {"port": 1}}))
+            loader = loaders.Json.load(path)
+
+            class Config(BaseConfig):
+                db: Variable[dict] = Variable("db")
+
+            conf = Config(loader)
+            loader["db"]["port"] = 2
+            self.assertFalse(loader.is_dirty)
+            conf.save()
+            self.assertEqual(
+                json.loads(path.read_text()), {"db": {"port": 2}}
+            )
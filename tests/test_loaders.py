@@ -1,6 +1,21 @@
+import asyncio
+import json
+import threading
+import time
+import os
 import unittest
+from unittest import mock
+
+import yaml
 
 from config_framework import loaders, VariableKey
+from config_framework.types.abstract import MISSING
+from config_framework.types.custom_exceptions import SavingError
+from config_framework.loaders.json_backends import available_backends
+from config_framework.loaders.parsed_cache import parsed_files_cache
+from config_framework.types.dump_scheduler import DumpScheduler
+from config_framework.types.lazy_mapping import LazyMapping
+from tests.utils import TempFile
 
 
 class TestBasicLoader(unittest.TestCase):
@@ -83,3 +98,576 @@ class TestBasicLoader(unittest.TestCase):
         loader = loaders.JsonString.load('{"hello": "world"}')
         with self.assertRaises(KeyError):
             var = loader["missing key"]
+
+    def test_lookup_cache_statistics(self):
+        loader = loaders.Dict.load({"first layer": {"internal": 1}})
+        loader.enable_lookup_cache()
+        key = VariableKey("first layer") / "internal"
+
+        self.assertEqual(loader[key], 1)
+        self.assertEqual(loader[key], 1)
+        self.assertEqual(tuple(loader.lookup_cache_stats), (1, 1, 1))
+
+    def test_lookup_cache_invalidation(self):
+        loader = loaders.Dict.load({"first layer": {"internal": 1}})
+        loader.enable_lookup_cache()
+        key = VariableKey("first layer") / "internal"
+
+        self.assertEqual(loader[key], 1)
+        loader[key] = 2
+        self.assertEqual(loader[key], 2)
+
+        del loader[key]
+        with self.assertRaises(KeyError):
+            var = loader[key]
+
+        loader.dump_to(loaders.Dict.load({}))
+        loader._replace_data({"first layer": {"internal": 3}}, {})
+        self.assertEqual(loader[key], 3)
+
+    def test_flat_index_lookups(self):
+        loader = loaders.Dict.load(
+            {"first layer": {"internal": 1}},
+            defaults={"second layer": {"internal": 2}},
+            flat_index=True
+        )
+        key = VariableKey("first layer") / "internal"
+
+        self.assertEqual(loader[key], 1)
+        self.assertEqual(loader[VariableKey("second layer") / "internal"], 2)
+        with self.assertRaises(KeyError):
+            var = loader[VariableKey("first layer") / "missing"]
+
+        self.assertEqual(loader.lookup_cache_stats.hits, 2)
+
+    def test_flat_index_follows_changes(self):
+        loader = loaders.Dict.load(
+            {"first layer": {"internal": {"deep": 1}}}, flat_index=True
+        )
+        key = VariableKey("first layer") / "internal"
+
+        loader[key] = {"deeper": 2}
+        self.assertEqual(loader[VariableKey("first layer") / "internal" / "deeper"], 2)
+        with self.assertRaises(KeyError):
+            var = loader[VariableKey("first layer") / "internal" / "deep"]
+
+        del loader["first layer"]
+        with self.assertRaises(KeyError):
+            var = loader[key]
+
+    def test_json_flat_index(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"first layer": {"internal": 1}}))
+            loader = loaders.Json.load(path, flat_index=True)
+
+        self.assertEqual(loader[VariableKey("first layer") / "internal"], 1)
+
+    def test_get_many(self):
+        loader = loaders.Dict.load(
+            {
+                "first layer": {"internal": 1, "other": 2},
+                "plain": "value"
+            },
+            defaults={"default": 3}
+        )
+
+        self.assertEqual(
+            loader.get_many([
+                VariableKey("first layer") / "internal",
+                VariableKey("first layer") / "other",
+                "plain",
+                "default",
+                VariableKey("first layer") / "missing",
+                VariableKey("plain") / "not a mapping"
+            ]),
+            [1, 2, "value", 3, MISSING, MISSING]
+        )
+
+    def test_get_many_after_direct_changes(self):
+        loader = loaders.Dict.load({"a": 1, "b": 2}, defaults={"c": 3})
+        self.assertEqual(len(loader.lookup_data), 3)
+
+        # Key set of view is outdated after that
+        del loader.data["a"]
+        self.assertNotIn("a", loader.lookup_data)
+        self.assertEqual(loader.lookup_data.get("a", 0), 0)
+        self.assertEqual(loader.get_many(["a", "b", "c"]), [MISSING, 2, 3])
+
+    def test_json_async_load_and_dump(self):
+        async def load_and_dump(path):
+            loader = await loaders.Json.aload(path)
+            loader["hello"] = "async world"
+            await loader.adump()
+
+        with TempFile() as path:
+            path.write_text(json.dumps({"hello": "world"}))
+            asyncio.run(load_and_dump(path))
+            self.assertEqual(json.loads(path.read_text()), {"hello": "async world"})
+
+    def test_lazy_json_loading(self):
+        with TempFile() as path:
+            path.unlink()
+            loader = loaders.Json.load(path, lazy=True, flat_index=True)
+            self.assertFalse(loader.data.loaded)
+
+            path.write_text(json.dumps({"first layer": {"internal": 1}}))
+            self.assertEqual(loader[VariableKey("first layer") / "internal"], 1)
+            self.assertTrue(loader.data.loaded)
+
+    def test_lazy_yaml_prefetch(self):
+        with TempFile() as path:
+            path.write_text("hello: world\n")
+            loader = loaders.Yaml.load(path, lazy=True)
+            loader.data.prefetch().join()
+
+            self.assertTrue(loader.data.loaded)
+            self.assertEqual(loader["hello"], "world")
+
+    def test_lazy_data_is_parsed_once(self):
+        calls = []
+
+        def parse():
+            calls.append(1)
+            time.sleep(0.01)
+            return {"hello": "world"}
+
+        data = LazyMapping(parse)
+        threads = [
+            threading.Thread(target=data.get, args=("hello",))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_json_backends(self):
+        for backend in available_backends:
+            with self.subTest(backend=backend), TempFile() as path:
+                path.write_text(
+                    json.dumps(
+                        {"hello": "мир", "nested": {"value": 1}, "ids": {}}
+                    ),
+                    encoding="utf8"
+                )
+                loader = loaders.Json.load(path, backend=backend)
+                self.assertEqual(loader["hello"], "мир")
+
+                loader["hello"] = "world"
+                loader["ids"] = {1: "one"}
+                loader.dump()
+                self.assertEqual(
+                    json.loads(path.read_text(encoding="utf8")),
+                    {
+                        "hello": "world", "nested": {"value": 1},
+                        "ids": {"1": "one"}
+                    }
+                )
+
+    def test_default_json_dump(self):
+        with TempFile() as path:
+            path.write_text(
+                json.dumps({"hello": "мир", "nested": {}}), encoding="utf8"
+            )
+            loader = loaders.Json.load(path)
+            loader["nested"] = {1: True}
+            loader.dump()
+
+            # Same as json.dump output whatever libraries are installed
+            self.assertEqual(
+                path.read_text(encoding="utf8"),
+                '{\n    "hello": "мир",\n    "nested": {\n'
+                '        "1": true\n    }\n}'
+            )
+
+    def test_default_json_parsing(self):
+        with TempFile() as path:
+            big_number = 2 ** 70
+            path.write_text(f'{{"nan": NaN, "big": {big_number}}}')
+            # Parsed by json module whatever libraries are installed
+            loader = loaders.Json.load(path)
+            self.assertEqual(loader["big"], big_number)
+            self.assertNotEqual(loader["nan"], loader["nan"])
+
+            path.write_text('{"hello": "world"}')
+            loader = loaders.Json.load(path, backend="fastest")
+            self.assertEqual(loader["hello"], "world")
+            self.assertEqual(loader.dump_backend.name, "json")
+
+    def test_json_compact_dump(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"hello": "world"}))
+            loader = loaders.Json.load(path, backend="json", compact=True)
+            loader.dump()
+
+            self.assertEqual(path.read_text(), '{"hello":"world"}')
+
+    def test_memory_mapped_reading(self):
+        for backend in available_backends:
+            with self.subTest(backend=backend), TempFile() as path:
+                path.write_text(json.dumps({"hello": "мир"}), encoding="utf8")
+                loader = loaders.Json.load(
+                    path, backend=backend, mmap_threshold=0
+                )
+                self.assertEqual(loader["hello"], "мир")
+
+        with TempFile() as path:
+            path.write_text("hello: world\n")
+            loader = loaders.Yaml.load(path, mmap_threshold=0)
+            self.assertEqual(loader["hello"], "world")
+
+    def test_parsed_files_cache(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"nested": {"value": 1}}))
+            hits = parsed_files_cache.stats().hits
+
+            first = loaders.Json.load(path, cached=True)
+            second = loaders.Yaml.load(path, cached=True)
+            third = loaders.Json.load(path, cached=True)
+            self.assertEqual(parsed_files_cache.stats().hits, hits + 1)
+
+            first[VariableKey("nested") / "value"] = 2
+            self.assertEqual(second[VariableKey("nested") / "value"], 1)
+            self.assertEqual(third[VariableKey("nested") / "value"], 1)
+
+            path.write_text(json.dumps({"nested": {"value": 3, "new": 1}}))
+            fourth = loaders.Json.load(path, cached=True)
+            self.assertEqual(fourth[VariableKey("nested") / "value"], 3)
+
+    def test_compiled_cache(self):
+        calls = []
+
+        def yaml_loader(stream):
+            calls.append(1)
+            return yaml.safe_load(stream)
+
+        with TempFile() as path:
+            cache_dir = path.parent / "compiled"
+            path.write_text("hello: world\n")
+            for _ in range(2):
+                loader = loaders.Yaml.load(
+                    path, yaml_loader=yaml_loader, compiled_cache=cache_dir
+                )
+                self.assertEqual(loader["hello"], "world")
+
+            self.assertEqual(len(calls), 1)
+
+            path.write_text("hello: changed world\n")
+            loader = loaders.Yaml.load(
+                path, yaml_loader=yaml_loader, compiled_cache=cache_dir
+            )
+            self.assertEqual(loader["hello"], "changed world")
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(len(list(cache_dir.iterdir())), 1)
+
+            # Loaders with other settings keep their own compiled files
+            for _ in range(3):
+                for only_keys in (None, ["hello"]):
+                    loaders.Yaml.load(
+                        path, yaml_loader=yaml_loader,
+                        compiled_cache=cache_dir, only_keys=only_keys
+                    )
+
+            self.assertEqual(len(calls), 3)
+            self.assertEqual(len(list(cache_dir.iterdir())), 2)
+
+    def test_selective_json_parsing(self):
+        document = {
+            "wanted": {"value": [1, {"a": "}"}], "other": "x"},
+            "skipped": {"deep": ["\\\"", {"]": None}], "n": -1.5e3},
+            "scalar": True,
+        }
+        for backend in available_backends:
+            with self.subTest(backend=backend), TempFile() as path:
+                path.write_text(json.dumps(document, indent=2))
+                loader = loaders.Json.load(
+                    path, backend=backend,
+                    only_keys=[
+                        VariableKey("wanted") / "value", "scalar",
+                        VariableKey("missing") / "key",
+                    ]
+                )
+                self.assertEqual(
+                    loader.data,
+                    {"wanted": {"value": [1, {"a": "}"}]}, "scalar": True}
+                )
+                with self.assertRaises(RuntimeError):
+                    loader.dump()
+
+        # Memory mapped and not utf-8 files with escaped and non-ascii keys
+        document = {"ключ \\\"": {"value": "мир", "other": 1}, "x": [1]}
+        for encoding in ("utf8", "utf-16"):
+            with self.subTest(encoding=encoding), TempFile() as path:
+                path.write_text(
+                    json.dumps(document, ensure_ascii=False), encoding=encoding
+                )
+                loader = loaders.Json.load(
+                    path, encoding=encoding, mmap_threshold=0,
+                    only_keys=[VariableKey("ключ \\\"") / "value"]
+                )
+                self.assertEqual(
+                    loader.data, {"ключ \\\"": {"value": "мир"}}
+                )
+
+    def test_selective_yaml_parsing(self):
+        with TempFile() as path:
+            path.write_text(
+                "base: &base\n  value: 1\n"
+                "merged:\n  <<: *base\n  other: 2\n"
+                "wanted:\n  value: [1, 2]\n  other: 3\n"
+            )
+            loader = loaders.Yaml.load(
+                path, only_keys=[
+                    VariableKey("merged") / "value",
+                    VariableKey("wanted") / "value"
+                ]
+            )
+            self.assertEqual(
+                loader.data,
+                {"merged": {"value": 1}, "wanted": {"value": [1, 2]}}
+            )
+
+            loader = loaders.Yaml.load(
+                path, yaml_loader=yaml.safe_load, only_keys=["wanted"]
+            )
+            self.assertEqual(
+                loader.data, {"wanted": {"value": [1, 2], "other": 3}}
+            )
+
+    def test_yaml_stream(self):
+        with TempFile() as path:
+            path.write_text(
+                "region: base\nlimits:\n  cpu: 1\n  memory: 2\n"
+                "---\nregion: eu\nlimits:\n  cpu: 4\n"
+            )
+            documents = loaders.YamlStream.iter_documents(path)
+            self.assertEqual(next(documents)["region"], "base")
+            self.assertEqual(next(documents)["region"], "eu")
+            self.assertIsNone(next(documents, None))
+
+            loader = loaders.YamlStream.load(path)
+            self.assertEqual(loader["region"], "eu")
+            self.assertEqual(loader[VariableKey("limits") / "cpu"], 4)
+            self.assertEqual(loader[VariableKey("limits") / "memory"], 2)
+
+            loader[VariableKey("limits") / "memory"] = 8
+            loader.dump()
+            self.assertEqual(
+                list(yaml.safe_load_all(path.read_text())),
+                [
+                    {"region": "base", "limits": {"cpu": 1, "memory": 8}},
+                    {"region": "eu", "limits": {"cpu": 4}},
+                ]
+            )
+
+            shallow = loaders.YamlStream.load(path, deep_merge=False)
+            self.assertEqual(shallow.get(VariableKey("limits") / "memory"), None)
+
+    def test_yaml_stream_async_load_and_dump(self):
+        async def load_and_dump(path):
+            loader = await loaders.YamlStream.aload(path)
+            loader["region"] = "us"
+            await loader.adump()
+            return loader
+
+        with TempFile() as path:
+            path.write_text("region: base\n---\nregion: eu\n")
+            loader = asyncio.run(load_and_dump(path))
+            self.assertIsInstance(loader, loaders.YamlStream)
+            self.assertEqual(
+                list(yaml.safe_load_all(path.read_text())),
+                [{"region": "base"}, {"region": "us"}]
+            )
+
+    def test_format_preserving_yaml_dump(self):
+        with TempFile() as path:
+            path.write_text(
+                "# Service settings\n"
+                "server:\n"
+                "  host: localhost  # overridden in production\n"
+                "  port: 8080\n"
+                "\n"
+                "name: 'service'\n"
+            )
+            loader = loaders.Yaml.load(path, preserve_format=True)
+            loader[VariableKey("server") / "port"] = 9090
+            loader["name"] = "new: name"
+            loader.dump()
+
+            self.assertEqual(
+                path.read_text(),
+                "# Service settings\n"
+                "server:\n"
+                "  host: localhost  # overridden in production\n"
+                "  port: 9090\n"
+                "\n"
+                "name: 'new: name'\n"
+            )
+
+            # Changed structure makes whole file written again
+            del loader[VariableKey("server") / "host"]
+            loader.dump()
+            self.assertEqual(
+                yaml.safe_load(path.read_text()),
+                {"server": {"port": 9090}, "name": "new: name"}
+            )
+            self.assertNotIn("#", path.read_text())
+
+    def test_saving_only_changed_loader(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"hello": "world"}))
+            loader = loaders.Json.load(path, backend="json")
+            self.assertFalse(loader.is_dirty)
+            self.assertFalse(loader.save())
+
+            loader.dump()
+            modified_at = path.stat().st_mtime_ns
+            time.sleep(0.01)
+
+            loader["hello"] = "world"
+            self.assertTrue(loader.is_dirty)
+            # Same content isn't written again
+            loader.dump()
+            self.assertEqual(path.stat().st_mtime_ns, modified_at)
+
+            loader["hello"] = "new world"
+            self.assertTrue(loader.save())
+            self.assertFalse(loader.is_dirty)
+            self.assertEqual(
+                json.loads(path.read_text()), {"hello": "new world"}
+            )
+
+    def test_write_behind_saving(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"counter": 0}))
+            loader = loaders.Json.load(path)
+            scheduler = DumpScheduler(delay=0.05)
+            loader.enable_write_behind(scheduler)
+
+            for counter in range(1, 6):
+                loader["counter"] = counter
+                loader.save()
+
+            self.assertEqual(scheduler.pending, 1)
+            self.assertEqual(json.loads(path.read_text()), {"counter": 0})
+
+            loader.flush()
+            self.assertEqual(scheduler.pending, 0)
+            self.assertEqual(json.loads(path.read_text()), {"counter": 5})
+
+            loader["counter"] = 6
+            loader.save()
+            time.sleep(0.3)
+            self.assertEqual(scheduler.pending, 0)
+            self.assertEqual(json.loads(path.read_text()), {"counter": 6})
+
+            loader.disable_write_behind()
+            self.assertEqual(list(path.parent.glob("*.tmp")), [])
+
+    def test_changes_while_saving(self):
+        with TempFile() as path:
+            path.write_text(json.dumps({"a": 0, "b": 0}))
+            dumping = threading.Event()
+            changed = threading.Event()
+            failing = False
+
+            def slow_dumper(data, stream):
+                dumping.set()
+                # Change from other thread doesn't wait for background save
+                changed.wait(0.2)
+                if failing:
+                    raise OSError("disk is full")
+
+                json.dump(data, stream)
+
+            loader = loaders.Json.load(path, json_dumper=slow_dumper)
+            scheduler = DumpScheduler(delay=60)
+            loader.enable_write_behind(scheduler)
+            loader["a"] = 1
+            loader.save()
+
+            saving = threading.Thread(target=scheduler.flush)
+            saving.start()
+            self.assertTrue(dumping.wait(1))
+            loader["b"] = 1
+            changed.set()
+            saving.join()
+
+            self.assertEqual(json.loads(path.read_text()), {"a": 1, "b": 0})
+            self.assertTrue(loader.is_dirty)
+
+            failing = True
+            loader.save()
+            with self.assertRaises(SavingError):
+                loader.flush()
+
+            self.assertTrue(loader.is_dirty)
+
+            failing = False
+            loader.disable_write_behind()
+            self.assertTrue(loader.save())
+            self.assertFalse(loader.is_dirty)
+            self.assertEqual(json.loads(path.read_text()), {"a": 1, "b": 1})
+
+            # Change from other thread waits until loader is saved right away
+            dumping.clear()
+            changed.clear()
+            writer = threading.Thread(
+                target=lambda: dumping.wait(1) and loader.__setitem__("b", 2)
+            )
+            writer.start()
+            loader["a"] = 2
+            self.assertTrue(loader.save())
+            changed.set()
+            writer.join()
+            self.assertEqual(json.loads(path.read_text()), {"a": 2, "b": 1})
+            self.assertTrue(loader.is_dirty)
+
+    def test_nested_environment(self):
+        environment = {
+            "APP__DB__POOL_SIZE": "10",
+            "app__db__Host": "localhost",
+            "APP__NAME": "service",
+            "APPLICATION": "not included",
+        }
+        with mock.patch.dict(os.environ, environment):
+            loader = loaders.Environment.load(prefix="APP")
+            self.assertEqual(set(loader.data), {"db", "name"})
+            self.assertEqual(loader[VariableKey("db") / "pool_size"], "10")
+            self.assertEqual(loader[VariableKey("DB") / "HOST"], "localhost")
+            self.assertIn("NAME", loader)
+
+            # Values are read from environment when they are accessed
+            os.environ["APP__NAME"] = "renamed"
+            self.assertEqual(loader["name"], "renamed")
+
+            loader[VariableKey("db") / "pool_size"] = 20
+            self.assertEqual(loader.get_many([("DB", "POOL_SIZE")]), [20])
+            self.assertEqual(os.environ["APP__DB__POOL_SIZE"], "10")
+
+            # Removed variables are reported missing, not raising
+            len(loader.lookup_data)
+            del os.environ["APP__NAME"]
+            self.assertEqual(loader.get_many(["name"]), [MISSING])
+            self.assertEqual(loader.get("name", "default"), "default")
+
+            with TempFile() as path:
+                path.write_text("db:\n  pool_size: 5\n  timeout: 30\n")
+                composite_loader = loaders.Composite.load(
+                    loaders.Environment.load(prefix="APP"),
+                    loaders.Yaml.load(path),
+                    deep_merge=True
+                )
+                self.assertEqual(
+                    composite_loader[VariableKey("db") / "pool_size"], "10"
+                )
+                self.assertEqual(
+                    composite_loader[VariableKey("db") / "timeout"], 30
+                )
+
+    def test_unknown_json_backend(self):
+        with self.assertRaises(ValueError):
+            loaders.Json.load("config.json", backend="not a json library")
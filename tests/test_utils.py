@@ -1,7 +1,8 @@
 import json
+import threading
 import unittest
 
-from config_framework import loaders, utils, Variable
+from config_framework import loaders, utils, Variable, BaseConfig
 
 
 class TestUtils(unittest.TestCase):
@@ -15,6 +16,7 @@ class TestUtils(unittest.TestCase):
                 "Variables": 3456
             }
         )
+        cls.loader_dict_version = loaders.Dict.load({"version": "42"})
 
     def test_translating_to_other_loader(self):
         specific_deserializer = utils.LoaderSpecificDeserializer(
@@ -63,3 +65,141 @@ class TestUtils(unittest.TestCase):
         version_variable._set_value_from_loader(self.loader_json)
 
         self.assertEqual(version_variable.serialize(), '"42"')
+
+    def test_serializing_configs_with_other_loaders(self):
+        specific_serializer = utils.LoaderSpecificSerializer(
+            {
+                loaders.JsonString: lambda var, value: json.dumps(value),
+                loaders.Dict: lambda var, value: value,
+            }
+        )
+
+        class Config(BaseConfig):
+            version = Variable("version")
+            version.register_serializer(specific_serializer)
+
+        dict_config = Config(loaders.Dict.load({"version": "1"}))
+        json_config = Config(self.loader_json)
+
+        self.assertEqual(Config.version.serialize(dict_config), "1")
+        self.assertEqual(Config.version.serialize(json_config), '"42"')
+        # Values of configs aren't kept by variable itself
+        self.assertFalse(hasattr(Config.version, "source"))
+        with self.assertRaises(ValueError):
+            Config.version.serialize()
+
+    def test_deserializing_configs_from_threads(self):
+        specific_deserializer = utils.LoaderSpecificDeserializer(
+            {
+                loaders.JsonString: lambda var, value: ("json", value),
+                loaders.Dict: lambda var, value: ("dict", value),
+            }
+        )
+
+        class Config(BaseConfig):
+            version = Variable("version")
+            version.register_deserializer(specific_deserializer)
+
+        class CompiledConfig(Config, compiled_init=True):
+            pass
+
+        def build(config_class, loader, kind, results):
+            for _ in range(300):
+                results.append(config_class(loader).version[0] == kind)
+
+        for config_class in (Config, CompiledConfig):
+            results: list = []
+            threads = [
+                threading.Thread(
+                    target=build,
+                    args=(config_class, self.loader_json, "json", results)
+                ),
+                threading.Thread(
+                    target=build,
+                    args=(config_class, self.loader_dict_version, "dict", results)
+                ),
+            ]
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            self.assertTrue(all(results))
+            self.assertFalse(hasattr(config_class.version, "source"))
+
+    def test_translating_from_composite_loader(self):
+        specific_deserializer = utils.LoaderSpecificDeserializer(
+            {
+                loaders.JsonString: lambda var, value: int(value),
+                loaders.Dict: lambda var, value: value * 2,
+            }
+        )
+        composite_loader = loaders.Composite.load(
+            self.loader_dict, self.loader_json
+        )
+        version_variable = Variable("version")
+        version_variable.register_deserializer(specific_deserializer)
+        version_variable._set_value_from_loader(composite_loader)
+
+        variables_variable = Variable("Variables")
+        variables_variable.register_deserializer(specific_deserializer)
+        variables_variable._set_value_from_loader(composite_loader)
+
+        self.assertEqual(version_variable._value, 42)
+        self.assertEqual(variables_variable._value, 6912)
+
+    def test_translating_from_subclassed_loader(self):
+        class CustomJsonString(loaders.JsonString):
+            pass
+
+        specific_deserializer = utils.LoaderSpecificDeserializer(
+            {
+                loaders.JsonString: lambda var, value: int(value),
+                "*": lambda var, value: value
+            }
+        )
+        version_variable = Variable("version")
+        version_variable.register_deserializer(specific_deserializer)
+        version_variable._set_value_from_loader(
+            CustomJsonString.load('{"version": "42"}')
+        )
+
+        self.assertEqual(version_variable._value, 42)
+
+    def test_missing_serializer(self):
+        specific_serializer = utils.LoaderSpecificSerializer(
+            {
+                loaders.Dict: lambda var, value: json.dumps(value),
+            }
+        )
+        version_variable = Variable("version")
+        version_variable.register_serializer(specific_serializer)
+        version_variable._set_value_from_loader(self.loader_json)
+
+        with self.assertRaises(KeyError):
+            version_variable.serialize()
+
+    def test_changing_deserializers(self):
+        handlers = {loaders.Dict: lambda var, value: value}
+        specific_deserializer = utils.LoaderSpecificDeserializer(handlers)
+        version_variable = Variable("version")
+        version_variable.register_deserializer(specific_deserializer)
+        version_variable._set_value_from_loader(
+            loaders.Dict.load({"version": 1})
+        )
+
+        # Remembered results don't hide changes made in place
+        specific_deserializer.deserializers["*"] = lambda var, value: str(value)
+        version_variable._set_value_from_loader(self.loader_json)
+        self.assertEqual(version_variable._value, "42")
+
+        handlers[loaders.JsonString] = lambda var, value: int(value)
+        version_variable._set_value_from_loader(self.loader_json)
+        self.assertEqual(version_variable._value, 42)
+
+        specific_deserializer.deserializers = {
+            loaders.JsonString: lambda var, value: -int(value)
+        }
+        version_variable._set_value_from_loader(self.loader_json)
+        self.assertEqual(version_variable._value, -42)
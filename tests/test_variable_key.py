@@ -1,6 +1,9 @@
 import unittest
 
 from config_framework import VariableKey
+from config_framework.loaders import Dict
+from config_framework.types import variable_key
+from config_framework.types.variable_key import compile_key
 
 
 class TestVariableKey(unittest.TestCase):
@@ -22,3 +25,41 @@ class TestVariableKey(unittest.TestCase):
             list(iter(combined_key)),
             ["hello", "world", "more complicated key", "ez"]
         )
+
+    def test_compiled_path_is_interned(self):
+        var_key1 = VariableKey("hello") / "world"
+        var_key2 = VariableKey("hello") / VariableKey("world")
+
+        self.assertEqual(var_key1.path, ("hello", "world"))
+        self.assertIs(var_key1.path, var_key2.path)
+        self.assertEqual(var_key1, var_key2)
+        self.assertEqual(hash(var_key1), hash(var_key2))
+
+    def test_extending_nested_piece_updates_path(self):
+        inner_key = VariableKey("world")
+        var_key = VariableKey("hello") / inner_key
+        self.assertEqual(str(var_key), "hello[/]world")
+
+        inner_key / "ez"
+        self.assertEqual(var_key.path, ("hello", "world", "ez"))
+        self.assertEqual(str(var_key), "hello[/]world[/]ez")
+
+    def test_interned_paths_are_bounded(self):
+        for number in range(variable_key.INTERNED_PATHS_LIMIT * 2):
+            variable_key.intern_path(("piece", str(number)))
+
+        cache_info = variable_key._interned_path.cache_info()
+        self.assertLessEqual(
+            cache_info.currsize, variable_key.INTERNED_PATHS_LIMIT
+        )
+        self.assertIs(
+            variable_key.intern_path(["hello", "bounded"]),
+            variable_key.intern_path(("hello", "bounded"))
+        )
+
+    def test_empty_path_is_rejected(self):
+        with self.assertRaises(ValueError):
+            compile_key(())
+
+        with self.assertRaises(ValueError):
+            Dict.load({"a": 1})[()] = 2